@@ -0,0 +1,194 @@
+"""Check that every moderation_tasks query is served by an index.
+
+Runs the repository and gateway queries against a seeded database,
+captures the SQL they emit and prints its EXPLAIN plan. Exits non-zero if
+any plan falls back to a full table scan. The database is SQLite unless
+``--db-uri`` is given.
+
+    python benchmarks/explain_task_queries.py
+"""
+
+import argparse
+import asyncio
+import sys
+import tempfile
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+from unittest.mock import Mock
+from uuid import uuid4
+
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncConnection, create_async_engine
+from uuid_extensions import uuid7  # type: ignore
+
+from moderation.application.models.pagination import Pagination, TaskCursor
+from moderation.domain.shared.user_id import UserId
+from moderation.domain.tasks.task_id import TaskID
+from moderation.domain.tasks.value_objects import ContentType, ModerationDecision
+from moderation.infrastructure.persistence.adapters.sql_task_archive_gateway import (
+    SqlTaskArchiveGateway,
+)
+from moderation.infrastructure.persistence.adapters.sql_task_gateway import (
+    SqlModerationTaskGateway,
+)
+from moderation.infrastructure.persistence.adapters.sql_task_repository import (
+    SqlModerationTaskRepository,
+)
+from moderation.infrastructure.persistence.entity_state_cache import (
+    EntityStateCache,
+)
+from moderation.infrastructure.persistence.read_connection_factory import (
+    ReadConnectionFactory,
+)
+from moderation.infrastructure.persistence.sql_tables import (
+    METADATA,
+    MODERATION_TASKS_TABLE,
+)
+
+type Query = Callable[[], Awaitable[Any]]
+
+
+async def seed(connection: AsyncConnection, admin_id: UserId, count: int) -> None:
+    now = datetime.now(UTC)
+    await connection.execute(
+        MODERATION_TASKS_TABLE.insert(),
+        [
+            {
+                "task_id": uuid7(),
+                "assigned_admin": admin_id if number % 10 == 0 else uuid4(),
+                "created_at": now,
+                "expiration": now + timedelta(days=1),
+                "content_type": ContentType.MEETUP,
+                "content_id": uuid4(),
+                "decision": (
+                    ModerationDecision.PENDING
+                    if number % 2
+                    else ModerationDecision.APPROVED
+                ),
+            }
+            for number in range(count)
+        ],
+    )
+    await connection.commit()
+
+
+async def capture(connection: AsyncConnection, query: Query) -> list[tuple[str, Any]]:
+    statements: list[tuple[str, Any]] = []
+
+    def on_execute(*arguments: Any) -> None:
+        statements.append((arguments[2], arguments[3]))
+
+    event.listen(connection.sync_engine, "before_cursor_execute", on_execute)
+    try:
+        await query()
+    finally:
+        event.remove(connection.sync_engine, "before_cursor_execute", on_execute)
+
+    return statements
+
+
+async def explain(connection: AsyncConnection, statement: str, parameters: Any) -> str:
+    if connection.dialect.name == "sqlite":
+        cursor_result = await connection.exec_driver_sql(
+            f"EXPLAIN QUERY PLAN {statement}", parameters
+        )
+        return "\n".join(row.detail for row in cursor_result)
+
+    cursor_result = await connection.exec_driver_sql(f"EXPLAIN {statement}", parameters)
+    return "\n".join(row[0] for row in cursor_result)
+
+
+def uses_index(plan: str) -> bool:
+    for line in plan.splitlines():
+        if "SCAN moderation_tasks" in line and "USING" not in line:
+            return False
+    return "Seq Scan" not in plan
+
+
+async def main(arguments: argparse.Namespace) -> int:
+    with tempfile.TemporaryDirectory() as directory:
+        db_uri = arguments.db_uri or f"sqlite+aiosqlite:///{Path(directory) / 'tasks.db'}"
+        engine = create_async_engine(db_uri)
+        failed = False
+
+        async with engine.connect() as connection:
+            await connection.run_sync(METADATA.drop_all)
+            await connection.run_sync(METADATA.create_all)
+            await connection.commit()
+
+            admin_id = UserId(uuid4())
+            await seed(connection, admin_id, arguments.tasks)
+            if connection.dialect.name == "postgresql":
+                await connection.exec_driver_sql("ANALYZE moderation_tasks")
+
+            sample = (
+                await connection.execute(select(MODERATION_TASKS_TABLE).limit(1))
+            ).one()
+            cursor = TaskCursor(sample.created_at, TaskID(sample.task_id)).encode()
+            repository = SqlModerationTaskRepository(
+                connection, Mock(), Mock(), EntityStateCache(max_size=0, ttl=0)
+            )
+            gateway = SqlModerationTaskGateway(ReadConnectionFactory(engine))
+            archive_gateway = SqlTaskArchiveGateway(connection)
+
+            queries: dict[str, Query] = {
+                "repository.with_task_id": lambda: repository.with_task_id(
+                    TaskID(sample.task_id)
+                ),
+                "repository.with_assigned_admin": lambda: (
+                    repository.with_assigned_admin(admin_id)
+                ),
+                "gateway.load_admin_tasks(offset)": lambda: gateway.load_admin_tasks(
+                    admin_id, Pagination(offset=40)
+                ),
+                "gateway.load_admin_tasks(after)": lambda: gateway.load_admin_tasks(
+                    admin_id, Pagination(after=cursor)
+                ),
+                "gateway.load_admin_tasks(include_archived)": lambda: (
+                    gateway.load_admin_tasks(
+                        admin_id, Pagination(after=cursor), include_archived=True
+                    )
+                ),
+                "archive batch": lambda: archive_gateway.archive_decided(
+                    created_before=datetime.now(UTC),
+                    archived_at=datetime.now(UTC),
+                    limit=10,
+                ),
+                "purge batch": lambda: archive_gateway.purge_archived(
+                    archived_before=datetime.now(UTC), limit=10
+                ),
+                "expiry sweep": lambda: connection.execute(
+                    select(MODERATION_TASKS_TABLE.c.task_id).where(
+                        MODERATION_TASKS_TABLE.c.decision == ModerationDecision.PENDING,
+                        MODERATION_TASKS_TABLE.c.expiration < datetime.now(UTC),
+                    )
+                ),
+                "content lookup": lambda: connection.execute(
+                    select(MODERATION_TASKS_TABLE.c.task_id).where(
+                        MODERATION_TASKS_TABLE.c.content_type == sample.content_type,
+                        MODERATION_TASKS_TABLE.c.content_id == sample.content_id,
+                    )
+                ),
+            }
+
+            for name, query in queries.items():
+                for statement, parameters in await capture(connection, query):
+                    if statement.lstrip().upper().startswith("INSERT"):
+                        continue
+
+                    plan = await explain(connection, statement, parameters)
+                    failed |= not uses_index(plan)
+                    status = "ok" if uses_index(plan) else "FULL SCAN"
+                    print(f"{name}: {status}\n    {plan.replace('\n', '\n    ')}")
+
+        await engine.dispose()
+        return int(failed)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=10_000)
+    parser.add_argument("--db-uri", default=None)
+    sys.exit(asyncio.run(main(parser.parse_args())))
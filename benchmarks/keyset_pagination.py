@@ -0,0 +1,132 @@
+"""Compare my-tasks page latency: OFFSET vs keyset cursor at deep pages.
+
+Seeds one admin with ``--tasks`` rows and times fetching a page near the
+start and at ``--page`` with both modes through SqlModerationTaskGateway.
+The database is SQLite unless ``--db-uri`` is given.
+
+    python benchmarks/keyset_pagination.py --tasks 200000 --page 10000
+"""
+
+import argparse
+import asyncio
+import tempfile
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from time import perf_counter
+from uuid import uuid4
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncConnection, create_async_engine
+from uuid_extensions import uuid7  # type: ignore
+
+from moderation.application.models.pagination import Pagination, TaskCursor
+from moderation.domain.shared.user_id import UserId
+from moderation.domain.tasks.value_objects import ContentType, ModerationDecision
+from moderation.infrastructure.persistence.adapters.sql_task_gateway import (
+    SqlModerationTaskGateway,
+)
+from moderation.infrastructure.persistence.read_connection_factory import (
+    ReadConnectionFactory,
+)
+from moderation.infrastructure.persistence.sql_tables import (
+    METADATA,
+    MODERATION_TASKS_TABLE,
+)
+
+
+async def seed(connection: AsyncConnection, admin_id: UserId, count: int) -> None:
+    started_at = datetime.now(UTC)
+    await connection.execute(
+        MODERATION_TASKS_TABLE.insert(),
+        [
+            {
+                "task_id": uuid7(),
+                "assigned_admin": admin_id,
+                "created_at": started_at + timedelta(milliseconds=number),
+                "expiration": started_at + timedelta(days=1),
+                "content_type": ContentType.MEETUP,
+                "content_id": uuid4(),
+                "decision": ModerationDecision.PENDING,
+            }
+            for number in range(count)
+        ],
+    )
+    await connection.commit()
+
+
+async def cursor_before(
+    connection: AsyncConnection, admin_id: UserId, offset: int
+) -> str | None:
+    if not offset:
+        return None
+
+    statement = (
+        select(MODERATION_TASKS_TABLE.c.created_at, MODERATION_TASKS_TABLE.c.task_id)
+        .where(MODERATION_TASKS_TABLE.c.assigned_admin == admin_id)
+        .order_by(MODERATION_TASKS_TABLE.c.created_at, MODERATION_TASKS_TABLE.c.task_id)
+        .offset(offset - 1)
+        .limit(1)
+    )
+    row = (await connection.execute(statement)).one()
+    return TaskCursor(row.created_at, row.task_id).encode()
+
+
+async def measure(
+    read_connection_factory: ReadConnectionFactory,
+    admin_id: UserId,
+    pagination: Pagination,
+    repeats: int,
+) -> float:
+    gateway = SqlModerationTaskGateway(read_connection_factory)
+    started = perf_counter()
+    for _ in range(repeats):
+        await gateway.load_admin_tasks(admin_id, pagination)
+    return (perf_counter() - started) / repeats * 1000
+
+
+async def main(arguments: argparse.Namespace) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        db_uri = arguments.db_uri or (
+            f"sqlite+aiosqlite:///{Path(directory) / 'tasks.db'}"
+        )
+        engine = create_async_engine(db_uri)
+        async with engine.connect() as connection:
+            await connection.run_sync(METADATA.drop_all)
+            await connection.run_sync(METADATA.create_all)
+            await connection.commit()
+
+            admin_id = UserId(uuid4())
+            await seed(connection, admin_id, arguments.tasks)
+            read_connection_factory = ReadConnectionFactory(engine)
+
+            for page in (1, arguments.page):
+                offset = (page - 1) * arguments.limit
+                after = await cursor_before(connection, admin_id, offset)
+                offset_ms = await measure(
+                    read_connection_factory,
+                    admin_id,
+                    Pagination(limit=arguments.limit, offset=offset),
+                    arguments.repeats,
+                )
+                keyset_ms = await measure(
+                    read_connection_factory,
+                    admin_id,
+                    Pagination(limit=arguments.limit, after=after),
+                    arguments.repeats,
+                )
+                print(
+                    f"page {page:>6}: offset {offset_ms:8.2f} ms, "
+                    f"keyset {keyset_ms:8.2f} ms"
+                )
+
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=200_000)
+    parser.add_argument("--page", type=int, default=10_000)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--repeats", type=int, default=20)
+    parser.add_argument("--db-uri", default=None)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,135 @@
+"""Compare outbox relay throughput: per-message loop vs pipelined batches.
+
+The broker is a local stand-in that acknowledges every publish after a
+fixed round-trip delay, which is what a publisher confirm costs against a
+real RabbitMQ node. The database is SQLite unless ``--db-uri`` is given.
+
+    python benchmarks/outbox_relay.py --messages 5000 --rtt-ms 1
+"""
+
+import argparse
+import asyncio
+import tempfile
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+from uuid import uuid4
+
+from sqlalchemy.ext.asyncio import AsyncConnection, create_async_engine
+from uuid_extensions import uuid7  # type: ignore
+
+from moderation.infrastructure.outbox.adapters.rabbitmq_outbox_publisher import (
+    RabbitmqOutboxPublisher,
+)
+from moderation.infrastructure.outbox.outbox_processor import OutboxProcessor
+from moderation.infrastructure.persistence.adapters.sql_outbox_gateway import (
+    SqlOutboxGateway,
+)
+from moderation.infrastructure.persistence.sql_tables import METADATA, OUTBOX_TABLE
+from moderation.infrastructure.utc_time_provider import UtcTimeProvider
+
+
+class StandInBroker:
+    def __init__(self, rtt: float) -> None:
+        self._rtt = rtt
+        self.published = 0
+
+    async def publish(self, **_: Any) -> None:
+        await asyncio.sleep(self._rtt)
+        self.published += 1
+
+
+async def fill_outbox(connection: AsyncConnection, count: int) -> None:
+    await connection.execute(OUTBOX_TABLE.delete())
+    await connection.execute(
+        OUTBOX_TABLE.insert(),
+        [
+            {"message_id": uuid7(), "data": "{}", "event_type": "ModerationStarted"}
+            for _ in range(count)
+        ],
+    )
+    await connection.commit()
+
+
+async def sequential_loop(
+    connection: AsyncConnection,
+    gateway: SqlOutboxGateway,
+    publisher: RabbitmqOutboxPublisher,
+    batch_size: int,
+) -> int:
+    owner = uuid4()
+    drained = 0
+    while messages := await gateway.claim(
+        owner=owner,
+        limit=batch_size,
+        now=(now := datetime.now(UTC)),
+        lease_until=now + timedelta(minutes=1),
+    ):
+        for message in messages:
+            await publisher.publish(message)
+            await gateway.delete(message)
+        await connection.commit()
+        drained += len(messages)
+    return drained
+
+
+async def pipelined_batches(
+    connection: AsyncConnection,
+    gateway: SqlOutboxGateway,
+    publisher: RabbitmqOutboxPublisher,
+    batch_size: int,
+) -> int:
+    processor = OutboxProcessor(
+        connection,  # type: ignore[arg-type]
+        gateway,
+        publisher,
+        UtcTimeProvider(),
+        batch_size=batch_size,
+        time_budget=float("inf"),
+        lease_duration=timedelta(minutes=1),
+        max_attempts=10,
+        retry_base_delay=timedelta(seconds=1),
+        retry_max_delay=timedelta(minutes=10),
+    )
+    return await processor.process()
+
+
+async def main(arguments: argparse.Namespace) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        db_uri = arguments.db_uri or (
+            f"sqlite+aiosqlite:///{Path(directory) / 'outbox.db'}"
+        )
+        engine = create_async_engine(db_uri)
+        async with engine.connect() as connection:
+            await connection.run_sync(METADATA.create_all)
+            await connection.commit()
+
+            gateway = SqlOutboxGateway(connection)
+            for name, relay in (
+                ("sequential", sequential_loop),
+                ("pipelined", pipelined_batches),
+            ):
+                await fill_outbox(connection, arguments.messages)
+                broker = StandInBroker(arguments.rtt_ms / 1000)
+                publisher = RabbitmqOutboxPublisher(broker)  # type: ignore[arg-type]
+
+                started = perf_counter()
+                drained = await relay(
+                    connection, gateway, publisher, arguments.batch_size
+                )
+                elapsed = perf_counter() - started
+
+                assert drained == arguments.messages == broker.published
+                print(f"{name:>10}: {drained / elapsed:10.0f} messages/s")
+
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=5000)
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--rtt-ms", type=float, default=1.0)
+    parser.add_argument("--db-uri", default=None)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,80 @@
+"""Compare outbox event serialization: ``to_json`` vs precompiled encoders.
+
+Both paths must produce byte-identical payloads; the benchmark asserts it
+before timing anything.
+
+    python benchmarks/outbox_serialization.py --events 200000
+"""
+
+import argparse
+from collections.abc import Callable
+from time import perf_counter
+from uuid import uuid4
+
+from moderation.domain.shared.events import DomainEvent
+from moderation.domain.tasks.events import (
+    AdminReassigned,
+    ModerationDecisionAdded,
+    ModerationStarted,
+)
+from moderation.domain.tasks.value_objects import (
+    ContentRef,
+    ContentType,
+    ModerationDecision,
+)
+from moderation.infrastructure.outbox.event_serializers import (
+    EventSerializersRegistry,
+)
+from moderation.infrastructure.outbox.outbox_event_types import OUTBOX_EVENT_TYPES
+from moderation.infrastructure.outbox.outbox_serialization import to_json
+from moderation.infrastructure.utc_time_provider import UtcTimeProvider
+
+
+def make_events() -> list[DomainEvent]:
+    now = UtcTimeProvider().provide_current()
+    events: list[DomainEvent] = [
+        ModerationStarted(
+            task_id=uuid4(),
+            assigned_admin=uuid4(),
+            expiration=now,
+            content_ref=ContentRef(ContentType.MEETUP, uuid4()),
+            event_date=now,
+        ),
+        ModerationDecisionAdded(
+            task_id=uuid4(),
+            decision=ModerationDecision.APPROVED,
+            content_ref=ContentRef(ContentType.POST, uuid4()),
+            event_date=now,
+        ),
+        AdminReassigned(task_id=uuid4(), assigned_admin=uuid4(), event_date=now),
+    ]
+    for event in events:
+        event.set_event_id(uuid4())
+    return events
+
+
+def measure(serialize: Callable[[DomainEvent], str], events: list[DomainEvent]) -> float:
+    started = perf_counter()
+    for event in events:
+        serialize(event)
+    return len(events) / (perf_counter() - started)
+
+
+def main(arguments: argparse.Namespace) -> None:
+    samples = make_events()
+    registry = EventSerializersRegistry(OUTBOX_EVENT_TYPES)
+    for event in samples:
+        assert registry.serialize(event) == to_json(event)
+
+    events = samples * (arguments.events // len(samples))
+    for name, serialize in (
+        ("to_json", to_json),
+        ("compiled", registry.serialize),
+    ):
+        print(f"{name:>10}: {measure(serialize, events):10.0f} events/s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=200_000)
+    main(parser.parse_args())
@@ -0,0 +1,130 @@
+"""Measure pool occupancy of LoadMyTasks queries with slow clients.
+
+Every request runs LoadMyTasks and then waits ``--client-delay`` seconds
+inside its request scope, which stands in for a slow client still
+reading the response. The "eager" run also resolves the request's
+AsyncConnection up front, the way the query graph used to. The "lazy"
+run relies on the read connection factory, which checks out an
+autocommit connection only for the query itself. A sampler records how
+many pooled connections are checked out while the load runs.
+
+    python benchmarks/read_pool_occupancy.py --requests 500 --concurrency 50
+"""
+
+import argparse
+import asyncio
+import tempfile
+from pathlib import Path
+from statistics import mean
+from time import perf_counter
+from uuid import uuid4
+
+from bazario.asyncio import Sender
+from sqlalchemy import QueuePool
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, create_async_engine
+from starlette.requests import Request
+
+from moderation.application.models.pagination import Pagination
+from moderation.application.operations.read.get_my_tasks import LoadMyTasks
+from moderation.application.operations.write.moderate_content import (
+    ModerateContent,
+)
+from moderation.bootstrap.config import (
+    AdminInboxConfig,
+    DatabaseConfig,
+    RabbitmqConfig,
+    TaskCacheConfig,
+)
+from moderation.bootstrap.container import bootstrap_api_container
+from moderation.domain.tasks.value_objects import ContentType
+from moderation.infrastructure.inbox.processed_message_filter import (
+    ProcessedMessageFilter,
+)
+from moderation.infrastructure.outbox.outbox_wakeup import OutboxWakeup
+from moderation.infrastructure.persistence.sql_tables import METADATA
+
+
+async def create_schema(db_uri: str) -> None:
+    engine = create_async_engine(db_uri)
+    async with engine.begin() as connection:
+        await connection.run_sync(METADATA.create_all)
+    await engine.dispose()
+
+
+async def run(
+    db_uri: str,
+    *,
+    eager: bool,
+    requests: int,
+    concurrency: int,
+    client_delay: float,
+) -> None:
+    container = bootstrap_api_container(
+        RabbitmqConfig(""),
+        DatabaseConfig(db_uri, pool_size=concurrency, max_overflow=0),
+        TaskCacheConfig(enabled=False, max_size=0, ttl=0),
+        AdminInboxConfig(serve_reads=False),
+        OutboxWakeup(),
+        ProcessedMessageFilter(max_size=0),
+    )
+    engine = await container.get(AsyncEngine)
+    pool = engine.pool
+    assert isinstance(pool, QueuePool)
+
+    async with container(context={Request: None}) as request_container:
+        sender = await request_container.get(Sender)
+        for _ in range(100):
+            await sender.send(ModerateContent(ContentType.MEETUP, uuid4()))
+
+    semaphore = asyncio.Semaphore(concurrency)
+    samples: list[int] = []
+
+    async def sample() -> None:
+        while True:
+            samples.append(pool.checkedout())
+            await asyncio.sleep(0.001)
+
+    async def send_query() -> None:
+        async with semaphore, container(context={Request: None}) as request_container:
+            if eager:
+                await request_container.get(AsyncConnection)
+
+            sender = await request_container.get(Sender)
+            await sender.send(LoadMyTasks(Pagination(limit=20, offset=0)))
+            await asyncio.sleep(client_delay)
+
+    sampler = asyncio.create_task(sample())
+    started = perf_counter()
+    await asyncio.gather(*(send_query() for _ in range(requests)))
+    elapsed = perf_counter() - started
+    sampler.cancel()
+    await container.close()
+
+    mode = "eager" if eager else "lazy"
+    print(
+        f"{mode:>5}: {requests / elapsed:7.0f} queries/s, "
+        f"checked out mean {mean(samples):5.1f} / peak {max(samples)} "
+        f"of {concurrency}"
+    )
+
+
+async def main(arguments: argparse.Namespace) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        for eager in (True, False):
+            db_uri = f"sqlite+aiosqlite:///{Path(directory) / f'{eager}.db'}"
+            await create_schema(db_uri)
+            await run(
+                db_uri,
+                eager=eager,
+                requests=arguments.requests,
+                concurrency=arguments.concurrency,
+                client_delay=arguments.client_delay,
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--client-delay", type=float, default=0.05)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,196 @@
+"""Load-test the review consumer at ten times the meetup rate.
+
+Runs the stream application against FastStream's in-memory test broker
+and a fresh SQLite database, once in the default mode with pooled
+connections and once in production mode (WAL and group commit).
+For ``--duration`` seconds it publishes
+MeetupCreated at ``--meetup-rate`` messages per second and ReviewAdded
+at ten times that rate. It then reports, per queue, the throughput
+reached, the handling latency, failed deliveries and the number of
+moderation tasks stored.
+Each database mode is run with per-message and batched review
+consumption, each in a fresh interpreter because the routers are module
+level.
+
+    python benchmarks/review_consumer_load.py --meetup-rate 50 --duration 10
+"""
+
+import argparse
+import asyncio
+import logging
+import multiprocessing
+import os
+import statistics
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from datetime import UTC, datetime
+from itertools import product
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+from uuid import uuid4
+
+from faststream.rabbit import TestRabbitBroker
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from moderation.bootstrap.entrypoints.stream import bootstrap_stream
+from moderation.infrastructure.persistence.sql_tables import (
+    METADATA,
+    MODERATION_TASKS_TABLE,
+)
+
+REVIEW_RATE_MULTIPLIER = 10
+
+
+def meetup_created() -> dict[str, Any]:
+    now = datetime.now(UTC).isoformat()
+    return {
+        "meetup_id": str(uuid4()),
+        "creator": str(uuid4()),
+        "time": {"start": now, "finish_date": now},
+        "location": {"address": "Main st. 1", "city": "Berlin", "country": "DE"},
+        "title": "Meetup",
+        "description": "Description",
+    }
+
+
+def review_added() -> dict[str, Any]:
+    return {
+        "review_id": str(uuid4()),
+        "reviewer_id": str(uuid4()),
+        "meetup_id": str(uuid4()),
+        "rating": 5,
+        "comment": "Great meetup",
+    }
+
+
+async def publish_at_rate(
+    broker: TestRabbitBroker,
+    queue: str,
+    build_message: Any,
+    rate: float,
+    duration: float,
+) -> tuple[list[float], int]:
+    latencies: list[float] = []
+    failed = 0
+
+    async def publish() -> None:
+        nonlocal failed
+        started = perf_counter()
+        try:
+            await broker.publish(
+                build_message(),
+                queue=queue,
+                exchange="meetups_exchange",
+                message_id=str(uuid4()),
+            )
+        except Exception:  # noqa: BLE001
+            failed += 1
+        else:
+            latencies.append(perf_counter() - started)
+
+    publications = []
+    started = perf_counter()
+    for number in range(int(rate * duration)):
+        await asyncio.sleep(max(0.0, started + number / rate - perf_counter()))
+        publications.append(asyncio.create_task(publish()))
+
+    await asyncio.gather(*publications)
+    return latencies, failed
+
+
+async def count_tasks(db_uri: str) -> dict[str, int]:
+    engine = create_async_engine(db_uri)
+    async with engine.connect() as connection:
+        cursor_rows = await connection.execute(
+            select(MODERATION_TASKS_TABLE.c.content_type, func.count()).group_by(
+                MODERATION_TASKS_TABLE.c.content_type
+            )
+        )
+        counts = {content_type.name: count for content_type, count in cursor_rows}
+    await engine.dispose()
+    return counts
+
+
+async def run(db_uri: str, meetup_rate: float, duration: float) -> str:
+    engine = create_async_engine(db_uri)
+    async with engine.begin() as connection:
+        await connection.run_sync(METADATA.create_all)
+    await engine.dispose()
+
+    application = bootstrap_stream()
+    assert application.broker is not None
+
+    async with TestRabbitBroker(application.broker) as broker:
+        started = perf_counter()
+        meetup_results, review_results = await asyncio.gather(
+            publish_at_rate(
+                broker, "created_meetups", meetup_created, meetup_rate, duration
+            ),
+            publish_at_rate(
+                broker,
+                "added_reviews",
+                review_added,
+                meetup_rate * REVIEW_RATE_MULTIPLIER,
+                duration,
+            ),
+        )
+        elapsed = perf_counter() - started
+
+    counts = await count_tasks(db_uri)
+    lines = []
+    for queue, (latencies, failed), content_type in (
+        ("created_meetups", meetup_results, "MEETUP"),
+        ("added_reviews", review_results, "MEETUP_REVIEW"),
+    ):
+        quantiles = statistics.quantiles(latencies, n=100)
+        lines.append(
+            f"  {queue:>15}: {len(latencies) / elapsed:7.0f} msg/s, "
+            f"p50 {quantiles[49] * 1000:6.1f} ms, p99 {quantiles[98] * 1000:6.1f} ms, "
+            f"{failed} failed, {counts.get(content_type, 0)} tasks"
+        )
+    return "\n".join(lines)
+
+
+def run_in_mode(
+    sqlite_production_mode: bool,
+    review_batching: bool,
+    meetup_rate: float,
+    duration: float,
+) -> str:
+    logging.disable(logging.CRITICAL)
+    os.environ["REVIEW_BATCH_ENABLED"] = str(review_batching).lower()
+    os.environ["DATABASE_SQLITE_PRODUCTION_MODE"] = str(sqlite_production_mode).lower()
+
+    with tempfile.TemporaryDirectory() as directory:
+        db_uri = f"sqlite+aiosqlite:///{Path(directory) / 'load.db'}"
+        os.environ["DATABASE_URI"] = db_uri
+        report = asyncio.run(run(db_uri, meetup_rate, duration))
+
+    database_mode = "production" if sqlite_production_mode else "default"
+    consumption_mode = "batched" if review_batching else "per-message"
+    return f"{consumption_mode} review consumption, {database_mode} SQLite:\n{report}"
+
+
+def main(arguments: argparse.Namespace) -> None:
+    for sqlite_production_mode, review_batching in product((False, True), repeat=2):
+        with ProcessPoolExecutor(
+            max_workers=1, mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            print(
+                executor.submit(
+                    run_in_mode,
+                    sqlite_production_mode,
+                    review_batching,
+                    arguments.meetup_rate,
+                    arguments.duration,
+                ).result()
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--meetup-rate", type=float, default=50)
+    parser.add_argument("--duration", type=float, default=10)
+    main(parser.parse_args())
@@ -0,0 +1,98 @@
+"""Compare SQLite commit throughput: default setup vs production mode.
+
+Sends ``--commands`` ModerateContent commands through the API container
+with ``--concurrency`` of them in flight, once with the default engine
+and once with DATABASE_SQLITE_PRODUCTION_MODE (WAL, pragmas and the
+group-committing writer). Commands that fail, e.g. on ``database is
+locked``, are counted separately.
+
+    python benchmarks/sqlite_group_commit.py --commands 2000 --concurrency 50
+"""
+
+import argparse
+import asyncio
+import tempfile
+from pathlib import Path
+from time import perf_counter
+from uuid import uuid4
+
+from bazario.asyncio import Sender
+from sqlalchemy.ext.asyncio import create_async_engine
+from starlette.requests import Request
+
+from moderation.application.operations.write.moderate_content import (
+    ModerateContent,
+)
+from moderation.bootstrap.config import (
+    AdminInboxConfig,
+    DatabaseConfig,
+    RabbitmqConfig,
+    TaskCacheConfig,
+)
+from moderation.bootstrap.container import bootstrap_api_container
+from moderation.domain.tasks.value_objects import ContentType
+from moderation.infrastructure.inbox.processed_message_filter import (
+    ProcessedMessageFilter,
+)
+from moderation.infrastructure.outbox.outbox_wakeup import OutboxWakeup
+from moderation.infrastructure.persistence.sql_tables import METADATA
+
+
+async def create_schema(db_uri: str) -> None:
+    engine = create_async_engine(db_uri)
+    async with engine.begin() as connection:
+        await connection.run_sync(METADATA.create_all)
+    await engine.dispose()
+
+
+async def run(database_config: DatabaseConfig, commands: int, concurrency: int) -> None:
+    container = bootstrap_api_container(
+        RabbitmqConfig(""),
+        database_config,
+        TaskCacheConfig(enabled=False, max_size=0, ttl=0),
+        AdminInboxConfig(serve_reads=False),
+        OutboxWakeup(),
+        ProcessedMessageFilter(max_size=0),
+    )
+    semaphore = asyncio.Semaphore(concurrency)
+    failed = 0
+
+    async def send_command() -> None:
+        nonlocal failed
+        async with semaphore, container(context={Request: None}) as request_container:
+            sender = await request_container.get(Sender)
+            try:
+                await sender.send(ModerateContent(ContentType.MEETUP, uuid4()))
+            except Exception:  # noqa: BLE001
+                failed += 1
+
+    started = perf_counter()
+    await asyncio.gather(*(send_command() for _ in range(commands)))
+    elapsed = perf_counter() - started
+    await container.close()
+
+    mode = "production" if database_config.sqlite_production_mode else "default"
+    print(f"{mode:>10}: {(commands - failed) / elapsed:8.0f} commits/s, {failed} failed")
+
+
+async def main(arguments: argparse.Namespace) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        for production_mode in (False, True):
+            db_uri = f"sqlite+aiosqlite:///{Path(directory) / f'{production_mode}.db'}"
+            await create_schema(db_uri)
+            await run(
+                DatabaseConfig(
+                    db_uri,
+                    pool_size=arguments.concurrency,
+                    sqlite_production_mode=production_mode,
+                ),
+                arguments.commands,
+                arguments.concurrency,
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--commands", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    asyncio.run(main(parser.parse_args()))
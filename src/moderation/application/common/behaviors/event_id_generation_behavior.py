@@ -13,8 +13,9 @@ class EventIdGenerationBehavior(PipelineBehavior[DomainEvent, None]):
         request: DomainEvent,
         handle_next: HandleNext[DomainEvent, None],
     ) -> None:
-        request.set_event_id(
-            self._id_generator.generate_event_id(),
-        )
+        if not request.event_id:
+            request.set_event_id(
+                self._id_generator.generate_event_id(),
+            )
 
         return await handle_next(request)
@@ -1,7 +1,40 @@
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as Base64Error
 from dataclasses import dataclass, field
+from datetime import datetime
+from uuid import UUID
+
+from moderation.application.common.application_error import (
+    ApplicationError,
+    ErrorType,
+)
+from moderation.domain.tasks.task_id import TaskID
 
 
 @dataclass(frozen=True)
 class Pagination:
     limit: int = field(default=20)
     offset: int = field(default=0)
+    after: str | None = field(default=None)
+
+
+@dataclass(frozen=True)
+class TaskCursor:
+    created_at: datetime
+    task_id: TaskID
+
+    def encode(self) -> str:
+        raw_cursor = f"{self.created_at.isoformat()}|{self.task_id}"
+        return urlsafe_b64encode(raw_cursor.encode()).decode()
+
+    @classmethod
+    def decode(cls, token: str) -> "TaskCursor":
+        try:
+            raw_cursor = urlsafe_b64decode(token.encode()).decode()
+            created_at, task_id = raw_cursor.split("|")
+            return cls(datetime.fromisoformat(created_at), TaskID(UUID(task_id)))
+        except (Base64Error, UnicodeError, ValueError) as error:
+            raise ApplicationError(
+                message="Invalid pagination cursor",
+                error_type=ErrorType.VALIDATION_ERROR,
+            ) from error
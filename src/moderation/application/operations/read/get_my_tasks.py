@@ -15,6 +15,7 @@ from moderation.application.ports.task_gateway import ModerationTaskGateway
 @dataclass(frozen=True)
 class LoadMyTasks(Query[Iterable[ModerationTaskReadModel]]):
     pagintation: Pagination
+    include_archived: bool = False
 
 
 class LoadMyTasksHandler(RequestHandler[LoadMyTasks, Iterable[ModerationTaskReadModel]]):
@@ -28,6 +29,10 @@ class LoadMyTasksHandler(RequestHandler[LoadMyTasks, Iterable[ModerationTaskRead
 
     async def handle(self, request: LoadMyTasks) -> Iterable[ModerationTaskReadModel]:
         user_id = await self._identity_provider.current_user_id()
-        tasks = await self._task_gateway.load_admin_tasks(user_id, request.pagintation)
+        tasks = await self._task_gateway.load_admin_tasks(
+            user_id,
+            request.pagintation,
+            include_archived=request.include_archived,
+        )
 
         return tasks
@@ -26,9 +26,13 @@ class ModerateContentHandler(RequestHandler[ModerateContent, TaskID]):
         self._task_repository = task_repository
 
     async def handle(self, request: ModerateContent) -> TaskID:
-        task = await self._task_factory.create(
-            ContentRef(request.content_type, request.content_id)
-        )
+        content_ref = ContentRef(request.content_type, request.content_id)
+        existing_task = await self._task_repository.with_content_ref(content_ref)
+
+        if existing_task:
+            return existing_task.entity_id
+
+        task = await self._task_factory.create(content_ref)
 
         self._task_repository.add(task)
 
@@ -0,0 +1,50 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+from bazario.asyncio import RequestHandler
+
+from moderation.application.common.markers.command import Command
+from moderation.domain.tasks.factory import ModerationTaskFactory
+from moderation.domain.tasks.repository import ModerationTaskRepository
+from moderation.domain.tasks.task_id import TaskID
+from moderation.domain.tasks.value_objects import ContentRef, ContentType
+
+
+@dataclass(frozen=True)
+class ModerateContents(Command[list[TaskID]]):
+    content_type: ContentType
+    content_ids: tuple[UUID, ...]
+    assume_new: bool = False
+
+
+class ModerateContentsHandler(RequestHandler[ModerateContents, list[TaskID]]):
+    def __init__(
+        self,
+        task_factory: ModerationTaskFactory,
+        task_repository: ModerationTaskRepository,
+    ) -> None:
+        self._task_factory = task_factory
+        self._task_repository = task_repository
+
+    async def handle(self, request: ModerateContents) -> list[TaskID]:
+        content_refs = [
+            ContentRef(request.content_type, content_id)
+            for content_id in request.content_ids
+        ]
+        task_ids: dict[ContentRef, TaskID] = {}
+
+        if not request.assume_new:
+            task_ids.update(
+                (task.content_ref, task.entity_id)
+                for task in await self._task_repository.with_content_refs(content_refs)
+            )
+
+        for content_ref in content_refs:
+            if content_ref in task_ids:
+                continue
+
+            task = await self._task_factory.create(content_ref)
+            self._task_repository.add(task)
+            task_ids[content_ref] = task.entity_id
+
+        return [task_ids[content_ref] for content_ref in content_refs]
@@ -9,5 +9,9 @@ from moderation.domain.shared.user_id import UserId
 class ModerationTaskGateway(ABC):
     @abstractmethod
     async def load_admin_tasks(
-        self, admin_id: UserId, pagination: Pagination
+        self,
+        admin_id: UserId,
+        pagination: Pagination,
+        *,
+        include_archived: bool = False,
     ) -> Iterable[ModerationTaskReadModel]: ...
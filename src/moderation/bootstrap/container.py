@@ -2,17 +2,31 @@ from alembic.config import Config as AlembicConfig
 from dishka import (
     AsyncContainer,
     Container,
+    Provider,
     make_async_container,
     make_container,
 )
 from dishka.integrations.fastapi import FastapiProvider
 from dishka.integrations.taskiq import TaskiqProvider
+from faststream import FastStream
 from faststream.rabbit import RabbitBroker
 from taskiq_aio_pika import AioPikaBroker
 from uvicorn import Config as UvicornConfig
 from uvicorn import Server as UvicornServer
 
-from moderation.bootstrap.config import DatabaseConfig, RabbitmqConfig
+from moderation.bootstrap.config import (
+    AdminInboxConfig,
+    ConsumerConfig,
+    DatabaseConfig,
+    InboxConfig,
+    MeetupBatchConfig,
+    OutboxConfig,
+    RabbitmqConfig,
+    ReplicaDatabaseConfig,
+    ReviewBatchConfig,
+    TaskArchiveConfig,
+    TaskCacheConfig,
+)
 from moderation.bootstrap.providers import (
     ApiConfigProvider,
     ApplicationAdaptersProvider,
@@ -20,18 +34,42 @@ from moderation.bootstrap.providers import (
     BazarioProvider,
     BrokerProvider,
     CliConfigProvider,
+    ConsumerConcurrencyProvider,
     DomainAdaptersProvider,
+    InboxPurgeProvider,
     InfrastructureAdaptersProvider,
+    MeetupBatchingProvider,
     OutboxProvider,
     PersistenceProvider,
+    ReplicaProvider,
+    ReviewBatchingProvider,
+    SharedSqliteWriterProvider,
+    SqliteGroupCommitProvider,
+    SqliteWriterProvider,
+    TaskArchiveProvider,
+)
+from moderation.infrastructure.inbox.processed_message_filter import (
+    ProcessedMessageFilter,
 )
+from moderation.infrastructure.outbox.outbox_wakeup import OutboxWakeup
+from moderation.infrastructure.persistence.adapters.sqlite_writer import SqliteWriter
+from moderation.presentation.cli.consumer import StreamApplicationFactory
 
 
 def bootstrap_api_container(
     rabbitmq_config: RabbitmqConfig,
     database_config: DatabaseConfig,
+    task_cache_config: TaskCacheConfig,
+    admin_inbox_config: AdminInboxConfig,
+    outbox_wakeup: OutboxWakeup,
+    processed_message_filter: ProcessedMessageFilter,
+    replica_database_config: ReplicaDatabaseConfig | None = None,
+    meetup_batch_config: MeetupBatchConfig | None = None,
+    review_batch_config: ReviewBatchConfig | None = None,
+    consumer_config: ConsumerConfig | None = None,
+    sqlite_writer: SqliteWriter | None = None,
 ) -> AsyncContainer:
-    return make_async_container(
+    providers: list[Provider] = [
         TaskiqProvider(),
         BazarioProvider(),
         FastapiProvider(),
@@ -41,11 +79,43 @@ def bootstrap_api_container(
         ApplicationAdaptersProvider(),
         ApplicationHandlersProvider(),
         InfrastructureAdaptersProvider(),
-        context={
-            DatabaseConfig: database_config,
-            RabbitmqConfig: rabbitmq_config,
-        },
-    )
+    ]
+
+    context: dict[object, object] = {
+        DatabaseConfig: database_config,
+        RabbitmqConfig: rabbitmq_config,
+        TaskCacheConfig: task_cache_config,
+        AdminInboxConfig: admin_inbox_config,
+        OutboxWakeup: outbox_wakeup,
+        ProcessedMessageFilter: processed_message_filter,
+    }
+
+    if database_config.is_sqlite_production:
+        providers.append(SqliteGroupCommitProvider())
+
+        if sqlite_writer:
+            providers.append(SharedSqliteWriterProvider())
+            context[SqliteWriter] = sqlite_writer
+        else:
+            providers.append(SqliteWriterProvider())
+
+    if replica_database_config:
+        providers.append(ReplicaProvider())
+        context[ReplicaDatabaseConfig] = replica_database_config
+
+    if meetup_batch_config and meetup_batch_config.enabled:
+        providers.append(MeetupBatchingProvider())
+        context[MeetupBatchConfig] = meetup_batch_config
+
+    if review_batch_config and review_batch_config.enabled:
+        providers.append(ReviewBatchingProvider())
+        context[ReviewBatchConfig] = review_batch_config
+
+    if consumer_config:
+        providers.append(ConsumerConcurrencyProvider())
+        context[ConsumerConfig] = consumer_config
+
+    return make_async_container(*providers, context=context)
 
 
 def bootstrap_cli_container(
@@ -53,6 +123,9 @@ def bootstrap_cli_container(
     uvicorn_config: UvicornConfig,
     uvicorn_server: UvicornServer,
     taskiq_broker: AioPikaBroker,
+    outbox_relay_application: FastStream,
+    worker_container: AsyncContainer,
+    stream_application_factory: StreamApplicationFactory,
 ) -> Container:
     return make_container(
         CliConfigProvider(),
@@ -61,6 +134,9 @@ def bootstrap_cli_container(
             UvicornConfig: uvicorn_config,
             UvicornServer: uvicorn_server,
             AioPikaBroker: taskiq_broker,
+            FastStream: outbox_relay_application,
+            AsyncContainer: worker_container,
+            StreamApplicationFactory: stream_application_factory,
         },
     )
 
@@ -68,11 +144,17 @@ def bootstrap_cli_container(
 def bootstrap_worker_container(
     rabbitmq_config: RabbitmqConfig,
     database_config: DatabaseConfig,
+    outbox_config: OutboxConfig,
+    task_archive_config: TaskArchiveConfig,
+    inbox_config: InboxConfig,
     faststream_rabbit_broker: RabbitBroker,
+    outbox_wakeup: OutboxWakeup,
 ) -> AsyncContainer:
     return make_async_container(
         BrokerProvider(),
         OutboxProvider(),
+        TaskArchiveProvider(),
+        InboxPurgeProvider(),
         ApiConfigProvider(),
         PersistenceProvider(),
         ApplicationAdaptersProvider(),
@@ -80,6 +162,10 @@ def bootstrap_worker_container(
         context={
             RabbitmqConfig: rabbitmq_config,
             DatabaseConfig: database_config,
+            OutboxConfig: outbox_config,
+            TaskArchiveConfig: task_archive_config,
+            InboxConfig: inbox_config,
             RabbitBroker: faststream_rabbit_broker,
+            OutboxWakeup: outbox_wakeup,
         },
     )
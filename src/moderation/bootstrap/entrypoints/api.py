@@ -10,15 +10,31 @@ from fastapi.middleware.cors import CORSMiddleware
 from starlette.types import HTTPExceptionHandler
 
 from moderation.application.common.application_error import ApplicationError
-from moderation.bootstrap.config import get_database_config, get_rabbitmq_config
+from moderation.bootstrap.config import (
+    get_admin_inbox_config,
+    get_consumer_config,
+    get_database_config,
+    get_inbox_config,
+    get_outbox_config,
+    get_rabbitmq_config,
+    get_replica_database_config,
+    get_task_cache_config,
+)
 from moderation.bootstrap.container import bootstrap_api_container
+from moderation.bootstrap.entrypoints.relay import bootstrap_relay
 from moderation.bootstrap.entrypoints.stream import bootstrap_stream
 from moderation.domain.shared.exceptions import DomainError
+from moderation.infrastructure.inbox.processed_message_filter import (
+    ProcessedMessageFilter,
+)
+from moderation.infrastructure.outbox.outbox_wakeup import OutboxWakeup
+from moderation.infrastructure.persistence.adapters.sqlite_writer import SqliteWriter
 from moderation.presentation.api.exception_handlers import (
     application_error_handler,
     domain_error_handler,
 )
 from moderation.presentation.api.routers.healthcheck import HEALTHCHECK_ROUTER
+from moderation.presentation.api.routers.metrics import METRICS_ROUTER
 from moderation.presentation.api.routers.moderation_task import (
     MODERATION_TASKS_ROUTER,
 )
@@ -26,10 +42,33 @@ from moderation.presentation.api.routers.moderation_task import (
 
 @asynccontextmanager
 async def lifespan(application: FastAPI) -> AsyncIterator[None]:
-    stream = bootstrap_stream()
-    await stream.start()
+    outbox_wakeup = await application.state.dishka_container.get(OutboxWakeup)
+    processed_message_filter = await application.state.dishka_container.get(
+        ProcessedMessageFilter
+    )
+    sqlite_writer = (
+        await application.state.dishka_container.get(SqliteWriter)
+        if get_database_config().is_sqlite_production
+        else None
+    )
+    stream = (
+        bootstrap_stream(outbox_wakeup, processed_message_filter, sqlite_writer)
+        if get_consumer_config().in_process
+        else None
+    )
+    relay = (
+        bootstrap_relay(outbox_wakeup) if get_outbox_config().relay_in_process else None
+    )
+
+    if stream:
+        await stream.start()
+    if relay:
+        await relay.start()
     yield
-    await stream.stop()
+    if relay:
+        await relay.stop()
+    if stream:
+        await stream.stop()
 
 
 def add_middlewares(application: FastAPI) -> None:
@@ -44,6 +83,7 @@ def add_middlewares(application: FastAPI) -> None:
 
 def add_api_routers(application: FastAPI) -> None:
     application.include_router(HEALTHCHECK_ROUTER)
+    application.include_router(METRICS_ROUTER)
     application.include_router(MODERATION_TASKS_ROUTER)
 
 
@@ -63,6 +103,11 @@ def bootstrap_application() -> FastAPI:
     dishka_container = bootstrap_api_container(
         get_rabbitmq_config(),
         get_database_config(),
+        get_task_cache_config(),
+        get_admin_inbox_config(),
+        OutboxWakeup(),
+        ProcessedMessageFilter(max_size=get_inbox_config().cache_size),
+        get_replica_database_config(),
     )
 
     add_middlewares(application)
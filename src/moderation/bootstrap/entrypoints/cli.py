@@ -1,19 +1,35 @@
 from click import Context, group, pass_context
 from dishka.integrations.click import setup_dishka
+from faststream.rabbit import RabbitBroker
 from uvicorn import Server as UvicornServer
 
 from moderation.bootstrap.config import (
     get_alembic_config,
+    get_database_config,
+    get_inbox_config,
+    get_outbox_config,
+    get_rabbitmq_config,
+    get_task_archive_config,
     get_taskiq_broker,
     get_uvicorn_config,
 )
-from moderation.bootstrap.container import bootstrap_cli_container
+from moderation.bootstrap.container import (
+    bootstrap_cli_container,
+    bootstrap_worker_container,
+)
+from moderation.bootstrap.entrypoints.relay import bootstrap_relay
+from moderation.bootstrap.entrypoints.stream import bootstrap_stream
+from moderation.infrastructure.outbox.outbox_wakeup import OutboxWakeup
+from moderation.presentation.cli.admin_inbox import rebuild_admin_inbox
+from moderation.presentation.cli.archive import archive
+from moderation.presentation.cli.consumer import consume
 from moderation.presentation.cli.migrations import (
     downgrade_migration,
     make_migrations,
     show_current_migration,
     upgrade_migration,
 )
+from moderation.presentation.cli.relay import start_relay
 from moderation.presentation.cli.server_starting import start_uvicorn
 from moderation.presentation.cli.worker import start_tasks, start_worker
 
@@ -25,8 +41,25 @@ def main(context: Context) -> None:
     uvicorn_config = get_uvicorn_config()
     uvicorn_server = UvicornServer(uvicorn_config)
     taskiq_broker = get_taskiq_broker()
+    outbox_relay_application = bootstrap_relay()
+    rabbitmq_config = get_rabbitmq_config()
+    worker_container = bootstrap_worker_container(
+        rabbitmq_config,
+        get_database_config(),
+        get_outbox_config(),
+        get_task_archive_config(),
+        get_inbox_config(),
+        RabbitBroker(rabbitmq_config.uri),
+        OutboxWakeup(),
+    )
     dishka_container = bootstrap_cli_container(
-        alembic_config, uvicorn_config, uvicorn_server, taskiq_broker
+        alembic_config,
+        uvicorn_config,
+        uvicorn_server,
+        taskiq_broker,
+        outbox_relay_application,
+        worker_container,
+        bootstrap_stream,
     )
     setup_dishka(dishka_container, context, finalize_container=True)
 
@@ -38,3 +71,7 @@ main.command(downgrade_migration)
 main.command(show_current_migration)
 main.command(start_tasks)
 main.command(start_worker)
+main.command(start_relay)
+main.command(consume)
+main.command(rebuild_admin_inbox)
+main.command(archive)
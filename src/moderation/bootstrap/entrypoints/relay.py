@@ -0,0 +1,44 @@
+from functools import partial
+
+from faststream import FastStream
+from faststream.rabbit import RabbitBroker
+
+from moderation.bootstrap.config import (
+    get_database_config,
+    get_inbox_config,
+    get_outbox_config,
+    get_rabbitmq_config,
+    get_task_archive_config,
+)
+from moderation.bootstrap.container import bootstrap_worker_container
+from moderation.bootstrap.entrypoints.tasks import declare_exchange
+from moderation.infrastructure.outbox.outbox_relay import OutboxRelay
+from moderation.infrastructure.outbox.outbox_wakeup import OutboxWakeup
+
+
+def bootstrap_relay(outbox_wakeup: OutboxWakeup | None = None) -> FastStream:
+    rabbitmq_config = get_rabbitmq_config()
+    outbox_config = get_outbox_config()
+    broker = RabbitBroker(rabbitmq_config.uri)
+    container = bootstrap_worker_container(
+        rabbitmq_config,
+        get_database_config(),
+        outbox_config,
+        get_task_archive_config(),
+        get_inbox_config(),
+        broker,
+        outbox_wakeup or OutboxWakeup(),
+    )
+    outbox_relay = OutboxRelay(
+        container,
+        min_poll_interval=outbox_config.min_poll_interval,
+        max_poll_interval=outbox_config.max_poll_interval,
+    )
+
+    application = FastStream(broker=broker)
+    application.after_startup(partial(declare_exchange, broker))
+    application.after_startup(outbox_relay.start)
+    application.on_shutdown(outbox_relay.stop)
+    application.after_shutdown(container.close)
+
+    return application
@@ -1,35 +1,118 @@
+from functools import partial
+
 from dishka.integrations.faststream import (
     setup_dishka as add_container_to_faststream,
 )
 from faststream import FastStream
 from faststream.rabbit.broker import RabbitBroker
 
-from moderation.bootstrap.config import get_database_config, get_rabbitmq_config
+from moderation.bootstrap.config import (
+    MeetupBatchConfig,
+    ReviewBatchConfig,
+    get_admin_inbox_config,
+    get_consumer_config,
+    get_database_config,
+    get_inbox_config,
+    get_meetup_batch_config,
+    get_rabbitmq_config,
+    get_replica_database_config,
+    get_review_batch_config,
+    get_task_cache_config,
+)
 from moderation.bootstrap.container import (
     bootstrap_api_container as bootstrap_stream_container,
 )
-from moderation.presentation.stream.consumers.meetups import MEETUPS_ROUTER
+from moderation.infrastructure.inbox.processed_message_filter import (
+    ProcessedMessageFilter,
+)
+from moderation.infrastructure.outbox.outbox_wakeup import OutboxWakeup
+from moderation.infrastructure.persistence.adapters.sqlite_writer import SqliteWriter
+from moderation.presentation.stream.concurrency_limit_middleware import (
+    ConcurrencyLimitMiddleware,
+)
+from moderation.presentation.stream.consumers.meetups import (
+    BATCHED_MEETUPS_ROUTER,
+    CREATED_MEETUPS_QUEUE,
+    MEETUPS_ROUTER,
+)
+from moderation.presentation.stream.consumers.reviews import (
+    ADDED_REVIEWS_QUEUE,
+    BATCHED_REVIEWS_ROUTER,
+    REVIEWS_ROUTER,
+)
+from moderation.presentation.stream.inbox_middleware import InboxMiddleware
 
 
 def add_middlewares(broker: RabbitBroker) -> None:
     pass
 
 
-def add_consumers(broker: RabbitBroker) -> None:
-    broker.include_router(MEETUPS_ROUTER)
+def add_consumers(
+    broker: RabbitBroker,
+    meetup_batch_config: MeetupBatchConfig,
+    review_batch_config: ReviewBatchConfig,
+) -> None:
+    if meetup_batch_config.enabled:
+        broker.include_router(
+            BATCHED_MEETUPS_ROUTER,
+            middlewares=[partial(InboxMiddleware, CREATED_MEETUPS_QUEUE.name)],
+        )
+    else:
+        broker.include_router(
+            MEETUPS_ROUTER,
+            middlewares=[
+                partial(ConcurrencyLimitMiddleware, CREATED_MEETUPS_QUEUE.name),
+                partial(InboxMiddleware, CREATED_MEETUPS_QUEUE.name),
+            ],
+        )
 
+    if review_batch_config.enabled:
+        broker.include_router(
+            BATCHED_REVIEWS_ROUTER,
+            middlewares=[partial(InboxMiddleware, ADDED_REVIEWS_QUEUE.name)],
+        )
+    else:
+        broker.include_router(
+            REVIEWS_ROUTER,
+            middlewares=[
+                partial(ConcurrencyLimitMiddleware, ADDED_REVIEWS_QUEUE.name),
+                partial(InboxMiddleware, ADDED_REVIEWS_QUEUE.name),
+            ],
+        )
 
-def bootstrap_stream() -> FastStream:
+
+def bootstrap_stream(
+    outbox_wakeup: OutboxWakeup | None = None,
+    processed_message_filter: ProcessedMessageFilter | None = None,
+    sqlite_writer: SqliteWriter | None = None,
+) -> FastStream:
     rabbit_config = get_rabbitmq_config()
-    broker = RabbitBroker(rabbit_config.uri)
+    meetup_batch_config = get_meetup_batch_config()
+    review_batch_config = get_review_batch_config()
+    consumer_config = get_consumer_config()
+    broker = RabbitBroker(rabbit_config.uri, max_consumers=consumer_config.prefetch_count)
 
     add_middlewares(broker=broker)
-    add_consumers(broker=broker)
+    add_consumers(
+        broker=broker,
+        meetup_batch_config=meetup_batch_config,
+        review_batch_config=review_batch_config,
+    )
 
     application = FastStream(broker=broker)
     container = bootstrap_stream_container(
         rabbitmq_config=rabbit_config,
         database_config=get_database_config(),
+        task_cache_config=get_task_cache_config(),
+        admin_inbox_config=get_admin_inbox_config(),
+        outbox_wakeup=outbox_wakeup or OutboxWakeup(),
+        processed_message_filter=processed_message_filter
+        or ProcessedMessageFilter(max_size=get_inbox_config().cache_size),
+        replica_database_config=get_replica_database_config(),
+        meetup_batch_config=meetup_batch_config,
+        review_batch_config=review_batch_config,
+        consumer_config=consumer_config,
+        sqlite_writer=sqlite_writer,
     )
     add_container_to_faststream(container=container, app=application)
 
@@ -9,11 +9,20 @@ from faststream.rabbit import (
 from taskiq import TaskiqEvents, TaskiqState
 from taskiq_aio_pika import AioPikaBroker
 
-from moderation.bootstrap.config import get_database_config, get_rabbitmq_config
+from moderation.bootstrap.config import (
+    get_database_config,
+    get_inbox_config,
+    get_outbox_config,
+    get_rabbitmq_config,
+    get_task_archive_config,
+)
 from moderation.bootstrap.container import bootstrap_worker_container
+from moderation.infrastructure.archive.archive_tasks_cron_task import archive_tasks
+from moderation.infrastructure.inbox.purge_inbox_cron_task import purge_inbox
 from moderation.infrastructure.outbox.adapters.rabbitmq_outbox_publisher import (
     ExchangeName,
 )
+from moderation.infrastructure.outbox.outbox_wakeup import OutboxWakeup
 from moderation.infrastructure.outbox.process_outbox_cron_task import (
     process_outbox,
 )
@@ -23,20 +32,26 @@ def add_tasks_to_taskiq(broker: AioPikaBroker) -> None:
     broker.register_task(
         process_outbox, "process_outbox", schedule=[{"cron": "*/1 * * * *"}]
     )
+    broker.register_task(archive_tasks, "archive_tasks", schedule=[{"cron": "0 * * * *"}])
+    broker.register_task(purge_inbox, "purge_inbox", schedule=[{"cron": "30 * * * *"}])
 
 
 async def start_broker(state: TaskiqState) -> None:
     await state.faststream_broker.start()
 
 
-async def bind_exchange(state: TaskiqState) -> None:
-    await state.faststream_broker.declare_exchange(
+async def declare_exchange(broker: RabbitBroker) -> None:
+    await broker.declare_exchange(
         RabbitExchange(
             name=ExchangeName.MODERATION, durable=True, type=ExchangeType.DIRECT
         )
     )
 
 
+async def bind_exchange(state: TaskiqState) -> None:
+    await declare_exchange(state.faststream_broker)
+
+
 def add_event_handlers(broker: AioPikaBroker) -> None:
     broker.add_event_handler(
         TaskiqEvents.WORKER_STARTUP,
@@ -62,7 +77,11 @@ def bootstrap_broker() -> AioPikaBroker:
     container = bootstrap_worker_container(
         rabbitmq_config,
         database_config,
+        get_outbox_config(),
+        get_task_archive_config(),
+        get_inbox_config(),
         faststream_rabbitmq_broker,
+        OutboxWakeup(),
     )
 
     add_tasks_to_taskiq(taskiq_broker)
@@ -1,18 +1,25 @@
 from collections.abc import AsyncIterator
+from datetime import timedelta
+from time import monotonic
+from typing import Any
 
 from alembic.config import Config as AlembicConfig
 from bazario.asyncio import Dispatcher, Registry
 from bazario.asyncio.resolvers.dishka import DishkaResolver
 from dishka import (
+    AsyncContainer,
     Provider,
     Scope,
     WithParents,
     alias,
+    decorate,
     from_context,
     provide,
     provide_all,
 )
+from faststream import FastStream
 from faststream.rabbit import RabbitBroker
+from sqlalchemy import make_url
 from sqlalchemy.ext.asyncio import (
     AsyncConnection,
     AsyncEngine,
@@ -40,31 +47,89 @@ from moderation.application.operations.write.moderate_content import (
     ModerateContent,
     ModerateContentHandler,
 )
+from moderation.application.operations.write.moderate_contents import (
+    ModerateContents,
+    ModerateContentsHandler,
+)
 from moderation.application.operations.write.provide_decision import (
     ProvideDecision,
     ProvideDecisionHandler,
 )
+from moderation.application.ports.context.identity_provider import IdentityProvider
+from moderation.application.ports.task_gateway import ModerationTaskGateway
+from moderation.application.ports.time_provider import TimeProvider
 from moderation.bootstrap.config import (
+    AdminInboxConfig,
+    ConsumerConfig,
     DatabaseConfig,
+    InboxConfig,
+    MeetupBatchConfig,
+    OutboxConfig,
     RabbitmqConfig,
+    ReplicaDatabaseConfig,
+    ReviewBatchConfig,
+    TaskArchiveConfig,
+    TaskCacheConfig,
 )
 from moderation.domain.shared.events import DomainEvent
+from moderation.domain.tasks.value_objects import ContentType
+from moderation.infrastructure.admin_inbox.admin_inbox_buffer import AdminInboxBuffer
+from moderation.infrastructure.admin_inbox.admin_inbox_projection_handler import (
+    AdminInboxProjectionHandler,
+)
+from moderation.infrastructure.admin_inbox.admin_inbox_rebuilder import (
+    AdminInboxRebuilder,
+)
+from moderation.infrastructure.archive.task_archive_gateway import TaskArchiveGateway
+from moderation.infrastructure.archive.task_archiver import TaskArchiver
 from moderation.infrastructure.domain_events import DomainEvents
 from moderation.infrastructure.fake_identity_provider import FakeIdentityProvider
+from moderation.infrastructure.inbox.inbox_buffer import InboxBuffer
+from moderation.infrastructure.inbox.inbox_gateway import InboxGateway
+from moderation.infrastructure.inbox.inbox_purger import InboxPurger
+from moderation.infrastructure.inbox.processed_message_filter import (
+    ProcessedMessageFilter,
+)
 from moderation.infrastructure.outbox.adapters.rabbitmq_outbox_publisher import (
     RabbitmqOutboxPublisher,
 )
+from moderation.infrastructure.outbox.event_serializers import (
+    EventSerializersRegistry,
+)
+from moderation.infrastructure.outbox.outbox_buffer import OutboxBuffer
+from moderation.infrastructure.outbox.outbox_event_types import OUTBOX_EVENT_TYPES
+from moderation.infrastructure.outbox.outbox_listener import (
+    OutboxListener,
+    PollingOutboxListener,
+)
+from moderation.infrastructure.outbox.outbox_notifier import OutboxNotifier
 from moderation.infrastructure.outbox.outbox_processor import OutboxProcessor
 from moderation.infrastructure.outbox.outbox_publisher import OutboxPublisher
 from moderation.infrastructure.outbox.outbox_storing_handler import (
     OutboxStoringHandler,
 )
+from moderation.infrastructure.outbox.outbox_wakeup import OutboxWakeup
+from moderation.infrastructure.persistence.adapters.pg_outbox_listener import (
+    PostgresOutboxListener,
+)
+from moderation.infrastructure.persistence.adapters.pinning_commit_executor import (
+    PinningCommitExecutor,
+)
+from moderation.infrastructure.persistence.adapters.sql_admin_inbox_gateway import (
+    SqlAdminInboxGateway,
+)
 from moderation.infrastructure.persistence.adapters.sql_data_mappers_registry import (
     SqlDataMappersRegistry,
 )
+from moderation.infrastructure.persistence.adapters.sql_inbox_gateway import (
+    SqlInboxGateway,
+)
 from moderation.infrastructure.persistence.adapters.sql_outbox_gateway import (
     SqlOutboxGateway,
 )
+from moderation.infrastructure.persistence.adapters.sql_task_archive_gateway import (
+    SqlTaskArchiveGateway,
+)
 from moderation.infrastructure.persistence.adapters.sql_task_data_mapper import (
     SqlModerationTaskDataMapper,
 )
@@ -74,13 +139,84 @@ from moderation.infrastructure.persistence.adapters.sql_task_gateway import (
 from moderation.infrastructure.persistence.adapters.sql_task_repository import (
     SqlModerationTaskRepository,
 )
+from moderation.infrastructure.persistence.adapters.sqlite_engine import (
+    configure_sqlite_engine,
+)
+from moderation.infrastructure.persistence.adapters.sqlite_group_commit_executor import (
+    SqliteGroupCommitExecutor,
+)
+from moderation.infrastructure.persistence.adapters.sqlite_writer import (
+    SqliteWriter,
+)
+from moderation.infrastructure.persistence.adapters.transaction_commit_executor import (
+    TransactionCommitExecutor,
+)
 from moderation.infrastructure.persistence.adapters.unit_of_work import (
     UnitOfWorkImpl,
 )
+from moderation.infrastructure.persistence.commit_executor import CommitExecutor
+from moderation.infrastructure.persistence.entity_state_cache import (
+    EntityStateCache,
+)
+from moderation.infrastructure.persistence.pool_metrics import PoolMetrics
+from moderation.infrastructure.persistence.read_connection_factory import (
+    ReadConnectionFactory,
+)
+from moderation.infrastructure.persistence.read_your_writes_tracker import (
+    ReadYourWritesTracker,
+)
+from moderation.infrastructure.persistence.replica_engine import ReplicaEngine
 from moderation.infrastructure.persistence.transaction import Transaction
 from moderation.infrastructure.task_factory import ModerationTaskFactoryImpl
 from moderation.infrastructure.utc_time_provider import UtcTimeProvider
 from moderation.infrastructure.uuid7_id_generator import UUID7IdGenerator
+from moderation.presentation.cli.consumer import StreamApplicationFactory
+from moderation.presentation.stream.concurrency_limiter import (
+    ConsumerConcurrencyLimiters,
+)
+from moderation.presentation.stream.consumers.meetups import (
+    CREATED_MEETUPS_QUEUE,
+    MeetupModerationBatcher,
+)
+from moderation.presentation.stream.consumers.reviews import (
+    ADDED_REVIEWS_QUEUE,
+    ReviewModerationBatcher,
+)
+from moderation.presentation.stream.content_moderation_batcher import (
+    ContentModerationBatcher,
+)
+
+
+def _create_engine(database_config: DatabaseConfig) -> AsyncEngine:
+    url = make_url(database_config.uri)
+    engine_options: dict[str, Any] = {
+        "pool_recycle": database_config.pool_recycle,
+        "pool_pre_ping": database_config.pool_pre_ping,
+    }
+
+    if url.database not in {None, "", ":memory:"}:
+        engine_options["pool_size"] = database_config.pool_size
+        engine_options["max_overflow"] = database_config.max_overflow
+        engine_options["pool_timeout"] = database_config.pool_timeout
+
+    if url.get_driver_name() == "asyncpg":
+        engine_options["connect_args"] = {
+            "prepared_statement_cache_size": database_config.statement_cache_size,
+            "server_settings": {
+                "statement_timeout": str(database_config.statement_timeout),
+            },
+        }
+
+    engine = create_async_engine(url, **engine_options)
+
+    if database_config.is_sqlite_production:
+        configure_sqlite_engine(
+            engine,
+            mmap_size=database_config.sqlite_mmap_size,
+            cache_size=database_config.sqlite_cache_size,
+        )
+
+    return engine
 
 
 class ApiConfigProvider(Provider):
@@ -88,22 +224,42 @@ class ApiConfigProvider(Provider):
 
     rabbitmq_config = from_context(RabbitmqConfig)
     database_config = from_context(DatabaseConfig)
+    outbox_wakeup = from_context(OutboxWakeup)
+    processed_message_filter = from_context(ProcessedMessageFilter)
+    task_cache_config = from_context(TaskCacheConfig)
+    admin_inbox_config = from_context(AdminInboxConfig)
 
 
 class PersistenceProvider(Provider):
     scope = Scope.REQUEST
 
     @provide(scope=Scope.APP)
-    async def engine(self, postgres_config: DatabaseConfig) -> AsyncIterator[AsyncEngine]:
-        engine = create_async_engine(postgres_config.uri)
+    async def engine(self, database_config: DatabaseConfig) -> AsyncIterator[AsyncEngine]:
+        engine = _create_engine(database_config)
         yield engine
         await engine.dispose()
 
+    pool_metrics = provide(PoolMetrics, scope=Scope.APP)
+
     @provide
-    async def connection(self, engine: AsyncEngine) -> AsyncIterator[AsyncConnection]:
+    async def connection(
+        self,
+        engine: AsyncEngine,
+        pool_metrics: PoolMetrics,
+    ) -> AsyncIterator[AsyncConnection]:
+        checkout_started_at = monotonic()
         async with engine.connect() as connection:
+            pool_metrics.record_checkout(monotonic() - checkout_started_at)
             yield connection
 
+    @provide(scope=Scope.APP)
+    def read_connection_factory(
+        self,
+        engine: AsyncEngine,
+        pool_metrics: PoolMetrics,
+    ) -> ReadConnectionFactory:
+        return ReadConnectionFactory(engine, pool_metrics)
+
 
 class DomainAdaptersProvider(Provider):
     scope = Scope.REQUEST
@@ -113,6 +269,14 @@ class DomainAdaptersProvider(Provider):
     )
     domain_events = provide(WithParents[DomainEvents])  # type: ignore[misc]
     unit_of_work = provide(WithParents[UnitOfWorkImpl])  # type: ignore[misc]
+
+    @provide(scope=Scope.APP)
+    def entity_state_cache(self, task_cache_config: TaskCacheConfig) -> EntityStateCache:
+        return EntityStateCache(
+            max_size=task_cache_config.max_size if task_cache_config.enabled else 0,
+            ttl=task_cache_config.ttl,
+        )
+
     task_factory = provide(
         WithParents[ModerationTaskFactoryImpl],  # type: ignore[misc]
     )
@@ -122,7 +286,8 @@ class ApplicationAdaptersProvider(Provider):
     scope = Scope.REQUEST
     gateways = provide_all(
         WithParents[SqlOutboxGateway],  # type: ignore[misc]
-        WithParents[SqlModerationTaskGateway],  # type: ignore[misc]
+        WithParents[SqlAdminInboxGateway],  # type: ignore[misc]
+        WithParents[SqlInboxGateway],  # type: ignore[misc]
     )
     id_generator = provide(
         WithParents[UUID7IdGenerator],  # type: ignore[misc]
@@ -137,17 +302,213 @@ class ApplicationAdaptersProvider(Provider):
         scope=Scope.APP,
     )
 
+    @provide
+    def task_gateway(
+        self,
+        read_connection_factory: ReadConnectionFactory,
+        admin_inbox_config: AdminInboxConfig,
+    ) -> ModerationTaskGateway:
+        return SqlModerationTaskGateway(
+            read_connection_factory,
+            serve_from_admin_inbox=admin_inbox_config.serve_reads,
+        )
+
 
 class InfrastructureAdaptersProvider(Provider):
     scope = Scope.REQUEST
 
     transaction = alias(AsyncConnection, provides=Transaction)
+    commit_executor = provide(
+        WithParents[TransactionCommitExecutor],  # type: ignore[misc]
+    )
     data_mappers = provide_all(
         WithParents[SqlModerationTaskDataMapper],  # type: ignore[misc]
     )
     data_mappers_registry = provide(
         WithParents[SqlDataMappersRegistry],  # type: ignore[misc]
     )
+    outbox_buffer = provide(OutboxBuffer)
+    outbox_notifier = provide(OutboxNotifier)
+    admin_inbox_buffer = provide(AdminInboxBuffer)
+    admin_inbox_rebuilder = provide(AdminInboxRebuilder)
+    inbox_buffer = provide(InboxBuffer)
+
+    @provide(scope=Scope.APP)
+    def event_serializers_registry(self) -> EventSerializersRegistry:
+        return EventSerializersRegistry(OUTBOX_EVENT_TYPES)
+
+
+class SqliteWriterProvider(Provider):
+    scope = Scope.APP
+
+    @provide
+    async def sqlite_writer(
+        self,
+        engine: AsyncEngine,
+        database_config: DatabaseConfig,
+    ) -> AsyncIterator[SqliteWriter]:
+        async with engine.connect() as connection:
+            sqlite_writer = SqliteWriter(
+                connection,
+                max_group_size=database_config.sqlite_max_group_size,
+            )
+            yield sqlite_writer
+            await sqlite_writer.close()
+
+
+class SharedSqliteWriterProvider(Provider):
+    scope = Scope.APP
+
+    sqlite_writer = from_context(SqliteWriter)
+
+
+class SqliteGroupCommitProvider(Provider):
+    scope = Scope.REQUEST
+
+    @provide
+    def task_data_mapper(
+        self, sqlite_writer: SqliteWriter
+    ) -> SqlModerationTaskDataMapper:
+        return SqlModerationTaskDataMapper(sqlite_writer.connection)
+
+    @provide
+    def outbox_buffer(self, sqlite_writer: SqliteWriter) -> OutboxBuffer:
+        return OutboxBuffer(SqlOutboxGateway(sqlite_writer.connection))
+
+    @provide
+    def admin_inbox_buffer(self, sqlite_writer: SqliteWriter) -> AdminInboxBuffer:
+        return AdminInboxBuffer(SqlAdminInboxGateway(sqlite_writer.connection))
+
+    @provide
+    def inbox_buffer(
+        self, sqlite_writer: SqliteWriter, time_provider: TimeProvider
+    ) -> InboxBuffer:
+        return InboxBuffer(SqlInboxGateway(sqlite_writer.connection), time_provider)
+
+    commit_executor = provide(
+        WithParents[SqliteGroupCommitExecutor],  # type: ignore[misc]
+    )
+
+
+class MeetupBatchingProvider(Provider):
+    scope = Scope.APP
+
+    meetup_batch_config = from_context(MeetupBatchConfig)
+
+    @provide
+    async def meetup_moderation_batcher(
+        self,
+        container: AsyncContainer,
+        meetup_batch_config: MeetupBatchConfig,
+        concurrency_limiters: ConsumerConcurrencyLimiters,
+    ) -> AsyncIterator[MeetupModerationBatcher]:
+        batcher = ContentModerationBatcher(
+            container,
+            ContentType.MEETUP,
+            concurrency_limiters,
+            CREATED_MEETUPS_QUEUE.name,
+            max_size=meetup_batch_config.max_size,
+            max_delay=meetup_batch_config.max_delay,
+        )
+        yield MeetupModerationBatcher(batcher)
+        await batcher.close()
+
+
+class ReviewBatchingProvider(Provider):
+    scope = Scope.APP
+
+    review_batch_config = from_context(ReviewBatchConfig)
+
+    @provide
+    async def review_moderation_batcher(
+        self,
+        container: AsyncContainer,
+        review_batch_config: ReviewBatchConfig,
+        concurrency_limiters: ConsumerConcurrencyLimiters,
+    ) -> AsyncIterator[ReviewModerationBatcher]:
+        batcher = ContentModerationBatcher(
+            container,
+            ContentType.MEETUP_REVIEW,
+            concurrency_limiters,
+            ADDED_REVIEWS_QUEUE.name,
+            max_size=review_batch_config.max_size,
+            max_delay=review_batch_config.max_delay,
+            assume_new=True,
+        )
+        yield ReviewModerationBatcher(batcher)
+        await batcher.close()
+
+
+class ConsumerConcurrencyProvider(Provider):
+    scope = Scope.APP
+
+    consumer_config = from_context(ConsumerConfig)
+
+    @provide
+    def consumer_concurrency_limiters(
+        self,
+        pool_metrics: PoolMetrics,
+        consumer_config: ConsumerConfig,
+    ) -> ConsumerConcurrencyLimiters:
+        return ConsumerConcurrencyLimiters(
+            pool_metrics,
+            max_in_flight=consumer_config.max_in_flight,
+            consumer_concurrency=consumer_config.concurrency,
+            min_consumer_concurrency=consumer_config.min_concurrency,
+            target_checkout_wait=consumer_config.target_checkout_wait,
+            adjust_interval=consumer_config.adjust_interval,
+        )
+
+
+class ReplicaProvider(Provider):
+    scope = Scope.REQUEST
+
+    replica_database_config = from_context(ReplicaDatabaseConfig, scope=Scope.APP)
+
+    @provide(scope=Scope.APP)
+    async def replica_engine(
+        self,
+        replica_database_config: ReplicaDatabaseConfig,
+    ) -> AsyncIterator[ReplicaEngine]:
+        engine = _create_engine(replica_database_config)
+        yield ReplicaEngine(engine)
+        await engine.dispose()
+
+    @provide(scope=Scope.APP)
+    def read_your_writes_tracker(
+        self,
+        database_config: DatabaseConfig,
+    ) -> ReadYourWritesTracker:
+        return ReadYourWritesTracker(database_config.read_your_writes_window)
+
+    @provide
+    async def read_connection_factory(
+        self,
+        engine: AsyncEngine,
+        replica_engine: ReplicaEngine,
+        pool_metrics: PoolMetrics,
+        identity_provider: IdentityProvider,
+        read_your_writes_tracker: ReadYourWritesTracker,
+    ) -> ReadConnectionFactory:
+        user_id = await identity_provider.current_user_id()
+
+        if read_your_writes_tracker.is_pinned(user_id):
+            return ReadConnectionFactory(engine, pool_metrics)
+
+        return ReadConnectionFactory(replica_engine)
+
+    @decorate
+    def commit_executor(
+        self,
+        commit_executor: CommitExecutor,
+        identity_provider: IdentityProvider,
+        read_your_writes_tracker: ReadYourWritesTracker,
+    ) -> CommitExecutor:
+        return PinningCommitExecutor(
+            commit_executor,
+            identity_provider,
+            read_your_writes_tracker,
+        )
 
 
 class ApplicationHandlersProvider(Provider):
@@ -155,8 +516,10 @@ class ApplicationHandlersProvider(Provider):
 
     handlers = provide_all(
         OutboxStoringHandler,
+        AdminInboxProjectionHandler,
         LoadMyTasksHandler,
         ModerateContentHandler,
+        ModerateContentsHandler,
         ProvideDecisionHandler,
     )
     behaviors = provide_all(
@@ -175,8 +538,13 @@ class BazarioProvider(Provider):
 
         registry.add_request_handler(LoadMyTasks, LoadMyTasksHandler)
         registry.add_request_handler(ModerateContent, ModerateContentHandler)
+        registry.add_request_handler(ModerateContents, ModerateContentsHandler)
         registry.add_request_handler(ProvideDecision, ProvideDecisionHandler)
-        registry.add_notification_handlers(DomainEvent, OutboxStoringHandler)
+        registry.add_notification_handlers(
+            DomainEvent,
+            AdminInboxProjectionHandler,
+            OutboxStoringHandler,
+        )
         registry.add_pipeline_behaviors(DomainEvent, EventIdGenerationBehavior)
         registry.add_pipeline_behaviors(
             Command,
@@ -190,6 +558,60 @@ class BazarioProvider(Provider):
     dispatcher = provide(WithParents[Dispatcher])  # type: ignore[misc]
 
 
+class TaskArchiveProvider(Provider):
+    scope = Scope.REQUEST
+
+    task_archive_config = from_context(TaskArchiveConfig, scope=Scope.APP)
+    task_archive_gateway = provide(
+        WithParents[SqlTaskArchiveGateway],  # type: ignore[misc]
+    )
+
+    @provide
+    def task_archiver(
+        self,
+        transaction: Transaction,
+        task_archive_gateway: TaskArchiveGateway,
+        time_provider: TimeProvider,
+        task_archive_config: TaskArchiveConfig,
+    ) -> TaskArchiver:
+        return TaskArchiver(
+            transaction,
+            task_archive_gateway,
+            time_provider,
+            archive_after=timedelta(days=task_archive_config.archive_after_days),
+            retention=(
+                timedelta(days=task_archive_config.retention_days)
+                if task_archive_config.retention_days
+                else None
+            ),
+            batch_size=task_archive_config.batch_size,
+            batch_pause=task_archive_config.batch_pause,
+        )
+
+
+class InboxPurgeProvider(Provider):
+    scope = Scope.REQUEST
+
+    inbox_config = from_context(InboxConfig, scope=Scope.APP)
+
+    @provide
+    def inbox_purger(
+        self,
+        transaction: Transaction,
+        inbox_gateway: InboxGateway,
+        time_provider: TimeProvider,
+        inbox_config: InboxConfig,
+    ) -> InboxPurger:
+        return InboxPurger(
+            transaction,
+            inbox_gateway,
+            time_provider,
+            retention=timedelta(hours=inbox_config.retention_hours),
+            batch_size=inbox_config.purge_batch_size,
+            batch_pause=inbox_config.purge_batch_pause,
+        )
+
+
 class CliConfigProvider(Provider):
     scope = Scope.APP
 
@@ -197,6 +619,9 @@ class CliConfigProvider(Provider):
     uvicorn_config = from_context(UvicornConfig)
     uvicorn_server = from_context(UvicornServer)
     taskiq_broker = from_context(AioPikaBroker)
+    outbox_relay_application = from_context(FastStream)
+    worker_container = from_context(AsyncContainer)
+    stream_application_factory = from_context(StreamApplicationFactory)
 
 
 class BrokerProvider(Provider):
@@ -208,6 +633,15 @@ class BrokerProvider(Provider):
 class OutboxProvider(Provider):
     scope = Scope.REQUEST
 
+    outbox_config = from_context(OutboxConfig, scope=Scope.APP)
+
+    @provide(scope=Scope.APP)
+    def outbox_listener(self, engine: AsyncEngine) -> OutboxListener:
+        if engine.dialect.driver == "asyncpg":
+            return PostgresOutboxListener(engine)
+
+        return PollingOutboxListener()
+
     @provide
     async def outbox_publisher(
         self,
@@ -221,9 +655,18 @@ class OutboxProvider(Provider):
         transaction: Transaction,
         outbox_gateway: SqlOutboxGateway,
         outbox_publisher: OutboxPublisher,
+        time_provider: TimeProvider,
+        outbox_config: OutboxConfig,
     ) -> OutboxProcessor:
         return OutboxProcessor(
             transaction=transaction,
             outbox_gateway=outbox_gateway,
             outbox_publisher=outbox_publisher,
+            time_provider=time_provider,
+            batch_size=outbox_config.batch_size,
+            time_budget=outbox_config.time_budget,
+            lease_duration=timedelta(seconds=outbox_config.lease_duration),
+            max_attempts=outbox_config.max_attempts,
+            retry_base_delay=timedelta(seconds=outbox_config.retry_base_delay),
+            retry_max_delay=timedelta(seconds=outbox_config.retry_max_delay),
         )
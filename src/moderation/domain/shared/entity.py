@@ -23,8 +23,8 @@ class Entity[TEntityID: Hashable]:
     def mark_new(self) -> None:
         self._unit_of_work.register_new(self)
 
-    def mark_dirty(self) -> None:
-        self._unit_of_work.register_dirty(self)
+    def mark_dirty(self, *fields: str) -> None:
+        self._unit_of_work.register_dirty(self, *fields)
 
     def mark_deleted(self) -> None:
         self._unit_of_work.register_deleted(self)
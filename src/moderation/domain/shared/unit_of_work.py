@@ -7,6 +7,6 @@ class UnitOfWork(ABC):
     @abstractmethod
     def register_new(self, entity: Entity) -> None: ...
     @abstractmethod
-    def register_dirty(self, entity: Entity) -> None: ...
+    def register_dirty(self, entity: Entity, *fields: str) -> None: ...
     @abstractmethod
     def register_deleted(self, entity: Entity) -> None: ...
@@ -6,3 +6,8 @@ from moderation.domain.shared.exceptions import DomainError
 @dataclass(frozen=True)
 class ModerationTaskIsReadyError(DomainError):
     message: str = "Task is already ready"
+
+
+@dataclass(frozen=True)
+class ModerationTaskAlreadyExistsError(DomainError):
+    message: str = "Content is already under moderation"
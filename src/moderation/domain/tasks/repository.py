@@ -1,9 +1,10 @@
 from abc import ABC, abstractmethod
-from collections.abc import Iterable
+from collections.abc import Collection, Iterable
 
 from moderation.domain.shared.user_id import UserId
 from moderation.domain.tasks.task import ModerationTask
 from moderation.domain.tasks.task_id import TaskID
+from moderation.domain.tasks.value_objects import ContentRef
 
 
 class ModerationTaskRepository(ABC):
@@ -15,3 +16,11 @@ class ModerationTaskRepository(ABC):
     async def with_task_id(self, task_id: TaskID) -> ModerationTask | None: ...
     @abstractmethod
     async def with_assigned_admin(self, admin_id: UserId) -> Iterable[ModerationTask]: ...
+    @abstractmethod
+    async def with_content_ref(
+        self, content_ref: ContentRef
+    ) -> ModerationTask | None: ...
+    @abstractmethod
+    async def with_content_refs(
+        self, content_refs: Collection[ContentRef]
+    ) -> Iterable[ModerationTask]: ...
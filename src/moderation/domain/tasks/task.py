@@ -67,20 +67,22 @@ class ModerationTask(Entity[TaskID]):
             content_ref=self._content_ref,
         )
 
-        self.mark_dirty()
+        self.mark_dirty("decision")
         self.add_event(event=event)
 
     def reassgin_admin(self, admin_id: UserId, current_date: datetime) -> None:
         self._ensure_is_pending()
 
-        self._assigned_admin = admin_id
+        if self._assigned_admin != admin_id:
+            self._assigned_admin = admin_id
+            self.mark_dirty("assigned_admin")
+
         event = AdminReassigned(
             task_id=self._entity_id,
             assigned_admin=admin_id,
             event_date=current_date,
         )
 
-        self.mark_dirty()
         self.add_event(event=event)
 
     def _ensure_is_pending(self) -> None:
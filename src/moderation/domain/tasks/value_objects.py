@@ -6,6 +6,7 @@ from uuid import UUID
 class ContentType(str, Enum):
     MEETUP = "meetup"
     POST = "post"
+    MEETUP_REVIEW = "meetup_review"
 
 
 class ModerationDecision(str, Enum):
@@ -0,0 +1,47 @@
+from dataclasses import replace
+
+from moderation.domain.shared.user_id import UserId
+from moderation.domain.tasks.task_id import TaskID
+from moderation.infrastructure.admin_inbox.admin_inbox_entry import AdminInboxEntry
+from moderation.infrastructure.admin_inbox.admin_inbox_gateway import (
+    AdminInboxGateway,
+)
+
+
+class AdminInboxBuffer:
+    def __init__(self, admin_inbox_gateway: AdminInboxGateway) -> None:
+        self._admin_inbox_gateway = admin_inbox_gateway
+        self._inserted: dict[TaskID, AdminInboxEntry] = {}
+        self._reassigned: dict[TaskID, UserId] = {}
+        self._deleted: set[TaskID] = set()
+
+    def add(self, entry: AdminInboxEntry) -> None:
+        self._inserted[entry.task_id] = entry
+
+    def reassign(self, task_id: TaskID, assigned_admin: UserId) -> None:
+        if entry := self._inserted.get(task_id):
+            self._inserted[task_id] = replace(entry, assigned_admin=assigned_admin)
+        else:
+            self._reassigned[task_id] = assigned_admin
+
+    def remove(self, task_id: TaskID) -> None:
+        if self._inserted.pop(task_id, None):
+            return
+
+        self._reassigned.pop(task_id, None)
+        self._deleted.add(task_id)
+
+    async def flush(self) -> None:
+        if self._inserted:
+            await self._admin_inbox_gateway.insert_many(list(self._inserted.values()))
+        if self._reassigned:
+            await self._admin_inbox_gateway.reassign_many(self._reassigned)
+        if self._deleted:
+            await self._admin_inbox_gateway.delete_many(self._deleted)
+
+        self.discard()
+
+    def discard(self) -> None:
+        self._inserted.clear()
+        self._reassigned.clear()
+        self._deleted.clear()
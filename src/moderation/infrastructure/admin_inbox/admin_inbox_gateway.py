@@ -0,0 +1,23 @@
+from abc import ABC, abstractmethod
+from collections.abc import Collection, Mapping, Sequence
+
+from moderation.domain.shared.user_id import UserId
+from moderation.domain.tasks.task_id import TaskID
+from moderation.infrastructure.admin_inbox.admin_inbox_entry import AdminInboxEntry
+
+
+class AdminInboxGateway(ABC):
+    @abstractmethod
+    async def insert_many(self, entries: Sequence[AdminInboxEntry]) -> None: ...
+    @abstractmethod
+    async def reassign_many(self, assigned_admins: Mapping[TaskID, UserId]) -> None: ...
+    @abstractmethod
+    async def delete_many(self, task_ids: Collection[TaskID]) -> None: ...
+    @abstractmethod
+    async def copy_pending_tasks(
+        self,
+        after: TaskID | None,
+        limit: int,
+    ) -> list[TaskID]: ...
+    @abstractmethod
+    async def delete_stale(self, limit: int) -> int: ...
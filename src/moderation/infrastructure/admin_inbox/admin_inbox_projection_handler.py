@@ -0,0 +1,33 @@
+from bazario.asyncio import NotificationHandler
+
+from moderation.domain.shared.events import DomainEvent
+from moderation.domain.tasks.events import (
+    AdminReassigned,
+    ModerationDecisionAdded,
+    ModerationStarted,
+)
+from moderation.infrastructure.admin_inbox.admin_inbox_buffer import AdminInboxBuffer
+from moderation.infrastructure.admin_inbox.admin_inbox_entry import AdminInboxEntry
+
+
+class AdminInboxProjectionHandler(NotificationHandler[DomainEvent]):
+    def __init__(self, admin_inbox_buffer: AdminInboxBuffer) -> None:
+        self._admin_inbox_buffer = admin_inbox_buffer
+
+    async def handle(self, notification: DomainEvent) -> None:
+        match notification:
+            case ModerationStarted():
+                entry = AdminInboxEntry(
+                    task_id=notification.task_id,
+                    assigned_admin=notification.assigned_admin,
+                    created_at=notification.event_date,
+                    expiration=notification.expiration,
+                    content_ref=notification.content_ref,
+                )
+                self._admin_inbox_buffer.add(entry)
+            case AdminReassigned():
+                self._admin_inbox_buffer.reassign(
+                    notification.task_id, notification.assigned_admin
+                )
+            case ModerationDecisionAdded():
+                self._admin_inbox_buffer.remove(notification.task_id)
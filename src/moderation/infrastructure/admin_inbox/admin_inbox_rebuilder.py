@@ -0,0 +1,37 @@
+from moderation.infrastructure.admin_inbox.admin_inbox_gateway import (
+    AdminInboxGateway,
+)
+from moderation.infrastructure.persistence.transaction import Transaction
+
+
+class AdminInboxRebuilder:
+    def __init__(
+        self,
+        transaction: Transaction,
+        admin_inbox_gateway: AdminInboxGateway,
+    ) -> None:
+        self._transaction = transaction
+        self._admin_inbox_gateway = admin_inbox_gateway
+
+    async def rebuild(self, batch_size: int) -> int:
+        copied = 0
+        last_task_id = None
+
+        while True:
+            task_ids = await self._admin_inbox_gateway.copy_pending_tasks(
+                last_task_id, batch_size
+            )
+            await self._transaction.commit()
+            copied += len(task_ids)
+
+            if len(task_ids) < batch_size:
+                break
+
+            last_task_id = task_ids[-1]
+
+        while True:
+            deleted = await self._admin_inbox_gateway.delete_stale(batch_size)
+            await self._transaction.commit()
+
+            if deleted < batch_size:
+                return copied
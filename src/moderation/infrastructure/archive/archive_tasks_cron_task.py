@@ -0,0 +1,12 @@
+from dishka import FromDishka
+from dishka.integrations.taskiq import inject
+
+from moderation.infrastructure.archive.task_archiver import TaskArchiver
+
+
+@inject
+async def archive_tasks(task_archiver: FromDishka[TaskArchiver]) -> int:
+    archived = await task_archiver.archive()
+    await task_archiver.purge()
+
+    return archived
@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+
+class TaskArchiveGateway(ABC):
+    @abstractmethod
+    async def archive_decided(
+        self,
+        *,
+        created_before: datetime,
+        archived_at: datetime,
+        limit: int,
+    ) -> int: ...
+    @abstractmethod
+    async def purge_archived(self, *, archived_before: datetime, limit: int) -> int: ...
@@ -0,0 +1,51 @@
+from datetime import timedelta
+
+from moderation.application.ports.time_provider import TimeProvider
+from moderation.infrastructure.archive.task_archive_gateway import TaskArchiveGateway
+from moderation.infrastructure.persistence.batch_runner import BatchRunner
+from moderation.infrastructure.persistence.transaction import Transaction
+
+
+class TaskArchiver:
+    def __init__(
+        self,
+        transaction: Transaction,
+        task_archive_gateway: TaskArchiveGateway,
+        time_provider: TimeProvider,
+        *,
+        archive_after: timedelta,
+        retention: timedelta | None,
+        batch_size: int,
+        batch_pause: float,
+    ) -> None:
+        self._task_archive_gateway = task_archive_gateway
+        self._time_provider = time_provider
+        self._archive_after = archive_after
+        self._retention = retention
+        self._batch_runner = BatchRunner(
+            transaction, batch_size=batch_size, batch_pause=batch_pause
+        )
+
+    async def archive(self) -> int:
+        now = self._time_provider.provide_current()
+
+        return await self._batch_runner.run(
+            lambda limit: self._task_archive_gateway.archive_decided(
+                created_before=now - self._archive_after,
+                archived_at=now,
+                limit=limit,
+            )
+        )
+
+    async def purge(self) -> int:
+        if self._retention is None:
+            return 0
+
+        archived_before = self._time_provider.provide_current() - self._retention
+
+        return await self._batch_runner.run(
+            lambda limit: self._task_archive_gateway.purge_archived(
+                archived_before=archived_before,
+                limit=limit,
+            )
+        )
@@ -0,0 +1,39 @@
+from collections.abc import Iterable
+
+from moderation.application.ports.time_provider import TimeProvider
+from moderation.infrastructure.inbox.inbox_gateway import InboxGateway
+from moderation.infrastructure.inbox.processed_message import ProcessedMessage
+
+
+class DuplicateMessageError(Exception):
+    def __init__(self, messages: set[ProcessedMessage]) -> None:
+        super().__init__(f"Messages already processed: {messages!r}")
+        self.messages = messages
+
+
+class InboxBuffer:
+    def __init__(self, inbox_gateway: InboxGateway, time_provider: TimeProvider) -> None:
+        self._inbox_gateway = inbox_gateway
+        self._time_provider = time_provider
+        self._messages: set[ProcessedMessage] = set()
+
+    def add(self, message: ProcessedMessage) -> None:
+        self._messages.add(message)
+
+    def add_many(self, messages: Iterable[ProcessedMessage]) -> None:
+        self._messages.update(messages)
+
+    async def flush(self) -> None:
+        if not self._messages:
+            return
+
+        if processed := await self._inbox_gateway.find_processed(self._messages):
+            self._messages -= processed
+            raise DuplicateMessageError(processed)
+
+        await self._inbox_gateway.insert_many(
+            self._messages, self._time_provider.provide_current()
+        )
+
+    def committed(self) -> None:
+        self._messages.clear()
@@ -0,0 +1,20 @@
+from abc import ABC, abstractmethod
+from collections.abc import Collection
+from datetime import datetime
+
+from moderation.infrastructure.inbox.processed_message import ProcessedMessage
+
+
+class InboxGateway(ABC):
+    @abstractmethod
+    async def find_processed(
+        self, messages: Collection[ProcessedMessage]
+    ) -> set[ProcessedMessage]: ...
+
+    @abstractmethod
+    async def insert_many(
+        self, messages: Collection[ProcessedMessage], processed_at: datetime
+    ) -> None: ...
+
+    @abstractmethod
+    async def purge(self, *, processed_before: datetime, limit: int) -> int: ...
@@ -0,0 +1,35 @@
+from datetime import timedelta
+
+from moderation.application.ports.time_provider import TimeProvider
+from moderation.infrastructure.inbox.inbox_gateway import InboxGateway
+from moderation.infrastructure.persistence.batch_runner import BatchRunner
+from moderation.infrastructure.persistence.transaction import Transaction
+
+
+class InboxPurger:
+    def __init__(
+        self,
+        transaction: Transaction,
+        inbox_gateway: InboxGateway,
+        time_provider: TimeProvider,
+        *,
+        retention: timedelta,
+        batch_size: int,
+        batch_pause: float,
+    ) -> None:
+        self._inbox_gateway = inbox_gateway
+        self._time_provider = time_provider
+        self._retention = retention
+        self._batch_runner = BatchRunner(
+            transaction, batch_size=batch_size, batch_pause=batch_pause
+        )
+
+    async def purge(self) -> int:
+        processed_before = self._time_provider.provide_current() - self._retention
+
+        return await self._batch_runner.run(
+            lambda limit: self._inbox_gateway.purge(
+                processed_before=processed_before,
+                limit=limit,
+            )
+        )
@@ -0,0 +1,7 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class ProcessedMessage:
+    consumer: str
+    message_id: str
@@ -0,0 +1,50 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from moderation.infrastructure.inbox.processed_message import ProcessedMessage
+
+
+@dataclass(frozen=True)
+class InboxStats:
+    size: int
+    max_size: int
+    memory_hits: int
+    database_hits: int
+
+
+class ProcessedMessageFilter:
+    def __init__(self, *, max_size: int) -> None:
+        self._max_size = max_size
+        self._messages: OrderedDict[ProcessedMessage, None] = OrderedDict()
+        self._memory_hits = 0
+        self._database_hits = 0
+
+    def seen(self, message: ProcessedMessage) -> bool:
+        if message not in self._messages:
+            return False
+
+        self._messages.move_to_end(message)
+        self._memory_hits += 1
+        return True
+
+    def remember(self, message: ProcessedMessage) -> None:
+        if self._max_size <= 0:
+            return
+
+        self._messages[message] = None
+        self._messages.move_to_end(message)
+
+        while len(self._messages) > self._max_size:
+            self._messages.popitem(last=False)
+
+    def record_database_hit(self, message: ProcessedMessage) -> None:
+        self._database_hits += 1
+        self.remember(message)
+
+    def stats(self) -> InboxStats:
+        return InboxStats(
+            size=len(self._messages),
+            max_size=self._max_size,
+            memory_hits=self._memory_hits,
+            database_hits=self._database_hits,
+        )
@@ -0,0 +1,9 @@
+from dishka import FromDishka
+from dishka.integrations.taskiq import inject
+
+from moderation.infrastructure.inbox.inbox_purger import InboxPurger
+
+
+@inject
+async def purge_inbox(inbox_purger: FromDishka[InboxPurger]) -> int:
+    return await inbox_purger.purge()
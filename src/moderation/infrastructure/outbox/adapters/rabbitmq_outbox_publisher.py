@@ -1,10 +1,15 @@
+import asyncio
+from collections.abc import Sequence
 from enum import StrEnum
 from typing import Final
 
 from faststream.rabbit import RabbitBroker
 
 from moderation.infrastructure.outbox.outbox_message import OutboxMessage
-from moderation.infrastructure.outbox.outbox_publisher import OutboxPublisher
+from moderation.infrastructure.outbox.outbox_publisher import (
+    OutboxPublisher,
+    OutboxPublishResult,
+)
 
 
 class QueueName(StrEnum):
@@ -30,3 +35,25 @@ class RabbitmqOutboxPublisher(OutboxPublisher):
             content_type=self._CONTENT_TYPE,
             persist=True,
         )
+
+    async def publish_batch(
+        self, messages: Sequence[OutboxMessage]
+    ) -> OutboxPublishResult:
+        # The channel runs in publisher confirms mode, so every publish
+        # resolves on the broker ack. Sending the whole window at once
+        # keeps all of them in flight and waits for the confirms together.
+        results = await asyncio.gather(
+            *(self.publish(message) for message in messages),
+            return_exceptions=True,
+        )
+
+        publish_result = OutboxPublishResult()
+        for message, result in zip(messages, results, strict=True):
+            if isinstance(result, Exception):
+                publish_result.failed.append((message, result))
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                publish_result.confirmed.append(message)
+
+        return publish_result
@@ -0,0 +1,94 @@
+import dataclasses
+import json
+from collections.abc import Callable, Iterable
+from datetime import datetime
+from enum import Enum
+from types import NoneType, UnionType
+from typing import Any, Union, get_args, get_origin, get_type_hints
+from uuid import UUID
+
+from moderation.domain.shared.events import DomainEvent
+from moderation.infrastructure.outbox.outbox_message import OutboxMessage
+
+type ValueDecoder = Callable[[Any], Any]
+
+
+def _decode_as_is(value: Any) -> Any:
+    return value
+
+
+def _optional(decoder: ValueDecoder) -> ValueDecoder:
+    def decode(value: Any) -> Any:
+        if value is None:
+            return None
+        return decoder(value)
+
+    return decode
+
+
+def _compile_value(annotation: Any) -> ValueDecoder:
+    while supertype := getattr(annotation, "__supertype__", None):
+        annotation = supertype
+
+    if get_origin(annotation) in {Union, UnionType}:
+        arguments = [
+            argument for argument in get_args(annotation) if argument is not NoneType
+        ]
+        if len(arguments) == 1:
+            return _optional(_compile_value(arguments[0]))
+        return _decode_as_is
+
+    if not isinstance(annotation, type):
+        return _decode_as_is
+    if issubclass(annotation, UUID):
+        return UUID
+    if issubclass(annotation, datetime):
+        return datetime.fromisoformat
+    if issubclass(annotation, Enum):
+        return annotation
+    if dataclasses.is_dataclass(annotation):
+        return _compile_dataclass(annotation)
+    return _decode_as_is
+
+
+def _compile_dataclass(dataclass_type: type) -> ValueDecoder:
+    type_hints = get_type_hints(dataclass_type)
+    init_fields: list[tuple[str, ValueDecoder]] = []
+    non_init_fields: list[tuple[str, ValueDecoder]] = []
+
+    for field in dataclasses.fields(dataclass_type):
+        decoder = _compile_value(type_hints[field.name])
+        if field.init:
+            init_fields.append((field.name, decoder))
+        else:
+            non_init_fields.append((field.name, decoder))
+
+    def decode(value: dict[str, Any]) -> Any:
+        instance = dataclass_type(
+            **{name: decoder(value[name]) for name, decoder in init_fields}
+        )
+        for name, decoder in non_init_fields:
+            object.__setattr__(instance, name, decoder(value[name]))
+        return instance
+
+    return decode
+
+
+class EventDeserializersRegistry:
+    def __init__(self, event_types: Iterable[type[DomainEvent]]) -> None:
+        self._deserializers: dict[str, ValueDecoder] = {
+            event_type.__name__: _compile_dataclass(event_type)
+            for event_type in event_types
+        }
+
+    def deserialize(self, event_type: str, data: str | bytes) -> DomainEvent:
+        deserializer = self._deserializers.get(event_type)
+
+        if not deserializer:
+            raise KeyError(f"Deserializer for {event_type!r} not registered")
+
+        event: DomainEvent = deserializer(json.loads(data))
+        return event
+
+    def deserialize_message(self, message: OutboxMessage) -> DomainEvent:
+        return self.deserialize(message.event_type, message.data)
@@ -0,0 +1,118 @@
+import dataclasses
+import json
+from collections.abc import Callable, Iterable
+from datetime import datetime
+from functools import partial
+from json.encoder import encode_basestring_ascii
+from operator import attrgetter
+from types import NoneType, UnionType
+from typing import Any, Union, get_args, get_origin, get_type_hints
+from uuid import UUID
+
+from moderation.domain.shared.events import DomainEvent
+from moderation.infrastructure.outbox.outbox_serialization import CustomJSONEncoder
+
+type ValueEncoder = Callable[[Any], str]
+
+_encode_fallback: ValueEncoder = partial(json.dumps, cls=CustomJSONEncoder)
+
+
+def _encode_uuid(value: Any) -> str:
+    if isinstance(value, UUID):
+        return f'"{value}"'
+    return _encode_fallback(value)
+
+
+def _encode_datetime(value: Any) -> str:
+    if isinstance(value, datetime):
+        return f'"{value.isoformat()}"'
+    return _encode_fallback(value)
+
+
+def _encode_str(value: Any) -> str:
+    if isinstance(value, str):
+        return encode_basestring_ascii(value)
+    return _encode_fallback(value)
+
+
+def _encode_int(value: Any) -> str:
+    if type(value) is int:
+        return int.__repr__(value)
+    return _encode_fallback(value)
+
+
+def _optional(encoder: ValueEncoder) -> ValueEncoder:
+    def encode(value: Any) -> str:
+        if value is None:
+            return "null"
+        return encoder(value)
+
+    return encode
+
+
+def _compile_value(annotation: Any) -> ValueEncoder:
+    while supertype := getattr(annotation, "__supertype__", None):
+        annotation = supertype
+
+    if get_origin(annotation) in {Union, UnionType}:
+        arguments = [
+            argument for argument in get_args(annotation) if argument is not NoneType
+        ]
+        if len(arguments) == 1:
+            return _optional(_compile_value(arguments[0]))
+        return _encode_fallback
+
+    if not isinstance(annotation, type):
+        return _encode_fallback
+    if issubclass(annotation, UUID):
+        return _encode_uuid
+    if issubclass(annotation, datetime):
+        return _encode_datetime
+    if issubclass(annotation, str):
+        return _encode_str
+    if annotation is int:
+        return _encode_int
+    if dataclasses.is_dataclass(annotation):
+        return _compile_dataclass(annotation)
+    return _encode_fallback
+
+
+def _compile_dataclass(dataclass_type: type) -> ValueEncoder:
+    type_hints = get_type_hints(dataclass_type)
+    field_encoders = [
+        (
+            f"{encode_basestring_ascii(field.name)}: ",
+            attrgetter(field.name),
+            _compile_value(type_hints[field.name]),
+        )
+        for field in dataclasses.fields(dataclass_type)
+    ]
+
+    def encode(value: Any) -> str:
+        if type(value) is not dataclass_type:
+            return _encode_fallback(value)
+
+        return (
+            "{"
+            + ", ".join(
+                [key + encoder(getter(value)) for key, getter, encoder in field_encoders]
+            )
+            + "}"
+        )
+
+    return encode
+
+
+class EventSerializersRegistry:
+    def __init__(self, event_types: Iterable[type[DomainEvent]]) -> None:
+        self._serializers: dict[type[DomainEvent], ValueEncoder] = {
+            event_type: _compile_dataclass(event_type) for event_type in event_types
+        }
+
+    def serialize(self, event: DomainEvent) -> str:
+        serializer = self._serializers.get(type(event))
+
+        if not serializer:
+            raise KeyError(f"Serializer for {event.event_type!r} not registered")
+
+        return serializer(event)
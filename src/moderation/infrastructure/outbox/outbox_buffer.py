@@ -0,0 +1,21 @@
+from moderation.infrastructure.outbox.outbox_gateway import OutboxGateway
+from moderation.infrastructure.outbox.outbox_message import OutboxMessage
+
+
+class OutboxBuffer:
+    def __init__(self, outbox_gateway: OutboxGateway) -> None:
+        self._outbox_gateway = outbox_gateway
+        self._messages: list[OutboxMessage] = []
+
+    def add(self, message: OutboxMessage) -> None:
+        self._messages.append(message)
+
+    async def flush(self) -> None:
+        if not self._messages:
+            return
+
+        await self._outbox_gateway.insert_many(self._messages)
+        self._messages.clear()
+
+    def discard(self) -> None:
+        self._messages.clear()
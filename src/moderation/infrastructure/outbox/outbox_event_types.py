@@ -0,0 +1,12 @@
+from moderation.domain.shared.events import DomainEvent
+from moderation.domain.tasks.events import (
+    AdminReassigned,
+    ModerationDecisionAdded,
+    ModerationStarted,
+)
+
+OUTBOX_EVENT_TYPES: tuple[type[DomainEvent], ...] = (
+    ModerationStarted,
+    ModerationDecisionAdded,
+    AdminReassigned,
+)
@@ -1,12 +1,42 @@
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from datetime import datetime
+from uuid import UUID
 
 from moderation.infrastructure.outbox.outbox_message import OutboxMessage
 
 
 class OutboxGateway(ABC):
     @abstractmethod
-    async def select(self) -> list[OutboxMessage]: ...
+    async def claim(
+        self,
+        *,
+        owner: UUID,
+        limit: int,
+        now: datetime,
+        lease_until: datetime,
+    ) -> list[OutboxMessage]: ...
     @abstractmethod
     async def insert(self, message: OutboxMessage) -> None: ...
     @abstractmethod
+    async def insert_many(self, messages: Sequence[OutboxMessage]) -> None: ...
+    @abstractmethod
+    async def reschedule(
+        self,
+        message: OutboxMessage,
+        *,
+        next_attempt_at: datetime,
+        error: str,
+    ) -> None: ...
+    @abstractmethod
+    async def move_to_dead_letters(
+        self,
+        message: OutboxMessage,
+        *,
+        failed_at: datetime,
+        error: str,
+    ) -> None: ...
+    @abstractmethod
     async def delete(self, message: OutboxMessage) -> None: ...
+    @abstractmethod
+    async def delete_many(self, messages: Sequence[OutboxMessage]) -> None: ...
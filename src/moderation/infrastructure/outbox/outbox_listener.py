@@ -0,0 +1,13 @@
+from abc import ABC, abstractmethod
+
+from moderation.infrastructure.outbox.outbox_wakeup import OutboxWakeup
+
+
+class OutboxListener(ABC):
+    @abstractmethod
+    async def listen(self, outbox_wakeup: OutboxWakeup) -> None: ...
+
+
+class PollingOutboxListener(OutboxListener):
+    async def listen(self, outbox_wakeup: OutboxWakeup) -> None:
+        return
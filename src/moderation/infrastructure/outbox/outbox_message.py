@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from uuid import UUID
 
 
@@ -7,3 +7,4 @@ class OutboxMessage:
     data: str | bytes
     event_type: str
     message_id: UUID
+    attempts: int = field(default=0)
@@ -0,0 +1,19 @@
+from moderation.infrastructure.outbox.outbox_wakeup import OutboxWakeup
+
+
+class OutboxNotifier:
+    def __init__(self, outbox_wakeup: OutboxWakeup) -> None:
+        self._outbox_wakeup = outbox_wakeup
+        self._has_pending_messages = False
+
+    def message_stored(self) -> None:
+        self._has_pending_messages = True
+
+    def notify(self) -> None:
+        if self._has_pending_messages:
+            self._outbox_wakeup.wake()
+
+        self._has_pending_messages = False
+
+    def discard(self) -> None:
+        self._has_pending_messages = False
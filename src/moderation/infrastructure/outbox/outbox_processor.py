@@ -1,4 +1,10 @@
+from datetime import datetime, timedelta
+from time import monotonic
+from uuid import uuid4
+
+from moderation.application.ports.time_provider import TimeProvider
 from moderation.infrastructure.outbox.outbox_gateway import OutboxGateway
+from moderation.infrastructure.outbox.outbox_message import OutboxMessage
 from moderation.infrastructure.outbox.outbox_publisher import OutboxPublisher
 from moderation.infrastructure.persistence.transaction import Transaction
 
@@ -9,16 +15,79 @@ class OutboxProcessor:
         transaction: Transaction,
         outbox_gateway: OutboxGateway,
         outbox_publisher: OutboxPublisher,
+        time_provider: TimeProvider,
+        *,
+        batch_size: int,
+        time_budget: float,
+        lease_duration: timedelta,
+        max_attempts: int,
+        retry_base_delay: timedelta,
+        retry_max_delay: timedelta,
     ) -> None:
         self._transaction = transaction
         self._outbox_gateway = outbox_gateway
         self._outbox_publisher = outbox_publisher
+        self._time_provider = time_provider
+        self._batch_size = batch_size
+        self._time_budget = time_budget
+        self._lease_duration = lease_duration
+        self._max_attempts = max_attempts
+        self._retry_base_delay = retry_base_delay
+        self._retry_max_delay = retry_max_delay
+        self._relay_id = uuid4()
+
+    async def process(self) -> int:
+        deadline = monotonic() + self._time_budget
+        drained = 0
+
+        while monotonic() < deadline:
+            now = self._time_provider.provide_current()
+            messages = await self._outbox_gateway.claim(
+                owner=self._relay_id,
+                limit=self._batch_size,
+                now=now,
+                lease_until=now + self._lease_duration,
+            )
+            await self._transaction.commit()
+
+            if not messages:
+                break
+
+            publish_result = await self._outbox_publisher.publish_batch(messages)
+            await self._outbox_gateway.delete_many(publish_result.confirmed)
+
+            failed_at = self._time_provider.provide_current()
+            for message, error in publish_result.failed:
+                await self._handle_failure(message, repr(error), failed_at)
+
+            await self._transaction.commit()
+            drained += len(publish_result.confirmed)
+
+            if len(messages) < self._batch_size:
+                break
+
+        return drained
+
+    async def _handle_failure(
+        self,
+        message: OutboxMessage,
+        error: str,
+        failed_at: datetime,
+    ) -> None:
+        attempts = message.attempts + 1
 
-    async def process(self) -> None:
-        messages = await self._outbox_gateway.select()
+        if attempts >= self._max_attempts:
+            await self._outbox_gateway.move_to_dead_letters(
+                message, failed_at=failed_at, error=error
+            )
+            return
 
-        for message in messages:
-            await self._outbox_publisher.publish(message)
-            await self._outbox_gateway.delete(message)
+        await self._outbox_gateway.reschedule(
+            message,
+            next_attempt_at=failed_at + self._retry_delay(attempts),
+            error=error,
+        )
 
-        await self._transaction.commit()
+    def _retry_delay(self, attempts: int) -> timedelta:
+        backoff_factor: int = 2 ** (attempts - 1)
+        return min(self._retry_base_delay * backoff_factor, self._retry_max_delay)
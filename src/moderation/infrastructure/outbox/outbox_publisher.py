@@ -1,8 +1,20 @@
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from dataclasses import dataclass, field
 
 from moderation.infrastructure.outbox.outbox_message import OutboxMessage
 
 
+@dataclass(frozen=True, kw_only=True)
+class OutboxPublishResult:
+    confirmed: list[OutboxMessage] = field(default_factory=list)
+    failed: list[tuple[OutboxMessage, Exception]] = field(default_factory=list)
+
+
 class OutboxPublisher(ABC):
     @abstractmethod
     async def publish(self, message: OutboxMessage) -> None: ...
+    @abstractmethod
+    async def publish_batch(
+        self, messages: Sequence[OutboxMessage]
+    ) -> OutboxPublishResult: ...
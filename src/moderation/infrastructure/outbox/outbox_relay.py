@@ -0,0 +1,71 @@
+import asyncio
+import logging
+from contextlib import suppress
+
+from dishka import AsyncContainer
+
+from moderation.infrastructure.outbox.outbox_listener import OutboxListener
+from moderation.infrastructure.outbox.outbox_processor import OutboxProcessor
+from moderation.infrastructure.outbox.outbox_wakeup import OutboxWakeup
+
+logger = logging.getLogger(__name__)
+
+
+class OutboxRelay:
+    def __init__(
+        self,
+        container: AsyncContainer,
+        *,
+        min_poll_interval: float,
+        max_poll_interval: float,
+    ) -> None:
+        self._container = container
+        self._min_poll_interval = min_poll_interval
+        self._max_poll_interval = max_poll_interval
+        self._task: asyncio.Task[None] | None = None
+
+    async def start(self) -> None:
+        self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def run(self) -> None:
+        outbox_wakeup = await self._container.get(OutboxWakeup)
+        outbox_listener = await self._container.get(OutboxListener)
+        listener_task = asyncio.create_task(outbox_listener.listen(outbox_wakeup))
+
+        try:
+            await self._relay(outbox_wakeup)
+        finally:
+            listener_task.cancel()
+
+    async def _relay(self, outbox_wakeup: OutboxWakeup) -> None:
+        poll_interval = self._min_poll_interval
+
+        while True:
+            try:
+                drained = await self._process()
+            except Exception:
+                logger.exception("Outbox relay run failed")
+                drained = 0
+
+            if drained:
+                poll_interval = self._min_poll_interval
+                continue
+
+            if await outbox_wakeup.wait(poll_interval):
+                poll_interval = self._min_poll_interval
+            else:
+                poll_interval = min(poll_interval * 2, self._max_poll_interval)
+
+    async def _process(self) -> int:
+        async with self._container() as request_container:
+            outbox_processor = await request_container.get(OutboxProcessor)
+            return await outbox_processor.process()
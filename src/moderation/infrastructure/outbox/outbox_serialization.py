@@ -16,27 +16,5 @@ class CustomJSONEncoder(json.JSONEncoder):
         return None
 
 
-class CustomJSONDecoder(json.JSONDecoder):
-    def object_hook(self, obj: dict[str, Any]) -> dict[str, Any]:
-        for key, value in obj.items():
-            if isinstance(value, str):
-                try:
-                    obj[key] = UUID(value)
-                    continue
-                except ValueError:
-                    pass
-
-                try:
-                    obj[key] = datetime.fromisoformat(value)
-                    continue
-                except ValueError:
-                    pass
-        return obj
-
-
 def to_json(obj: object) -> str:
     return json.dumps(obj, cls=CustomJSONEncoder)
-
-
-def from_json(json_string: str | bytes) -> Any:
-    return json.loads(json_string, cls=CustomJSONDecoder)
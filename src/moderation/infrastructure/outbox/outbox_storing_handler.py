@@ -3,19 +3,30 @@ from uuid import UUID
 from bazario.asyncio import NotificationHandler
 
 from moderation.domain.shared.events import DomainEvent
-from moderation.infrastructure.outbox.outbox_gateway import OutboxGateway
+from moderation.infrastructure.outbox.event_serializers import (
+    EventSerializersRegistry,
+)
+from moderation.infrastructure.outbox.outbox_buffer import OutboxBuffer
 from moderation.infrastructure.outbox.outbox_message import OutboxMessage
-from moderation.infrastructure.outbox.outbox_serialization import to_json
+from moderation.infrastructure.outbox.outbox_notifier import OutboxNotifier
 
 
 class OutboxStoringHandler(NotificationHandler[DomainEvent]):
-    def __init__(self, outbox_gateway: OutboxGateway) -> None:
-        self._outbox_gateway = outbox_gateway
+    def __init__(
+        self,
+        outbox_buffer: OutboxBuffer,
+        outbox_notifier: OutboxNotifier,
+        serializers_registry: EventSerializersRegistry,
+    ) -> None:
+        self._outbox_buffer = outbox_buffer
+        self._outbox_notifier = outbox_notifier
+        self._serializers_registry = serializers_registry
 
     async def handle(self, notification: DomainEvent) -> None:
         message = OutboxMessage(
-            data=to_json(notification),
+            data=self._serializers_registry.serialize(notification),
             message_id=UUID(str(notification.event_id)),
             event_type=notification.event_type,
         )
-        await self._outbox_gateway.insert(message)
+        self._outbox_buffer.add(message)
+        self._outbox_notifier.message_stored()
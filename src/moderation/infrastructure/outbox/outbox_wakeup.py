@@ -0,0 +1,20 @@
+import asyncio
+
+
+class OutboxWakeup:
+    def __init__(self) -> None:
+        self._event = asyncio.Event()
+
+    def wake(self) -> None:
+        self._event.set()
+
+    async def wait(self, poll_interval: float) -> bool:
+        try:
+            async with asyncio.timeout(poll_interval):
+                await self._event.wait()
+        except TimeoutError:
+            return False
+        finally:
+            self._event.clear()
+
+        return True
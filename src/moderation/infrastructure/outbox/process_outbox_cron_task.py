@@ -5,5 +5,5 @@ from moderation.infrastructure.outbox.outbox_processor import OutboxProcessor
 
 
 @inject
-async def process_outbox(outbox_processor: FromDishka[OutboxProcessor]) -> None:
-    await outbox_processor.process()
+async def process_outbox(outbox_processor: FromDishka[OutboxProcessor]) -> int:
+    return await outbox_processor.process()
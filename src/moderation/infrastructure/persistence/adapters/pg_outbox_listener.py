@@ -0,0 +1,51 @@
+import asyncio
+import logging
+from typing import Any, Final
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from moderation.infrastructure.outbox.outbox_listener import OutboxListener
+from moderation.infrastructure.outbox.outbox_wakeup import OutboxWakeup
+
+logger = logging.getLogger(__name__)
+
+
+class PostgresOutboxListener(OutboxListener):
+    CHANNEL: Final[str] = "outbox"
+    _RECONNECT_DELAY: Final[float] = 1.0
+
+    def __init__(self, engine: AsyncEngine) -> None:
+        self._engine = engine
+
+    async def listen(self, outbox_wakeup: OutboxWakeup) -> None:
+        def on_notification(*_: Any) -> None:
+            outbox_wakeup.wake()
+
+        while True:
+            try:
+                await self._listen_until_disconnected(on_notification)
+            except Exception:
+                logger.exception("Outbox listener connection failed")
+
+            # Anything committed while we were reconnecting was not announced.
+            outbox_wakeup.wake()
+            await asyncio.sleep(self._RECONNECT_DELAY)
+
+    async def _listen_until_disconnected(self, on_notification: Any) -> None:
+        disconnected = asyncio.Event()
+
+        async with self._engine.connect() as connection:
+            raw_connection = await connection.get_raw_connection()
+            driver_connection = raw_connection.driver_connection
+
+            if driver_connection is None:
+                raise RuntimeError("Outbox listener requires an asyncpg connection")
+
+            driver_connection.add_termination_listener(
+                lambda *_: disconnected.set(),
+            )
+            await driver_connection.add_listener(self.CHANNEL, on_notification)
+            try:
+                await disconnected.wait()
+            finally:
+                await driver_connection.remove_listener(self.CHANNEL, on_notification)
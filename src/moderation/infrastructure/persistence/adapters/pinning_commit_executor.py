@@ -0,0 +1,26 @@
+from moderation.application.ports.context.identity_provider import IdentityProvider
+from moderation.infrastructure.persistence.commit_executor import (
+    CommitExecutor,
+    Flush,
+)
+from moderation.infrastructure.persistence.read_your_writes_tracker import (
+    ReadYourWritesTracker,
+)
+
+
+class PinningCommitExecutor(CommitExecutor):
+    def __init__(
+        self,
+        commit_executor: CommitExecutor,
+        identity_provider: IdentityProvider,
+        read_your_writes_tracker: ReadYourWritesTracker,
+    ) -> None:
+        self._commit_executor = commit_executor
+        self._identity_provider = identity_provider
+        self._read_your_writes_tracker = read_your_writes_tracker
+
+    async def execute(self, flush: Flush) -> None:
+        await self._commit_executor.execute(flush)
+
+        user_id = await self._identity_provider.current_user_id()
+        self._read_your_writes_tracker.record_write(user_id)
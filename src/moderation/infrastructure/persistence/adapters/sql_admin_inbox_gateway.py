@@ -0,0 +1,124 @@
+from collections.abc import Collection, Mapping, Sequence
+from uuid import UUID
+
+from sqlalchemy import Select, bindparam, delete, insert, or_, select, update
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncConnection
+from sqlalchemy.sql.dml import ReturningInsert
+
+from moderation.domain.shared.user_id import UserId
+from moderation.domain.tasks.task_id import TaskID
+from moderation.domain.tasks.value_objects import ModerationDecision
+from moderation.infrastructure.admin_inbox.admin_inbox_entry import AdminInboxEntry
+from moderation.infrastructure.admin_inbox.admin_inbox_gateway import (
+    AdminInboxGateway,
+)
+from moderation.infrastructure.persistence.sql_tables import (
+    ADMIN_INBOX_TABLE,
+    MODERATION_TASKS_TABLE,
+)
+
+
+class SqlAdminInboxGateway(AdminInboxGateway):
+    def __init__(self, connection: AsyncConnection) -> None:
+        self._connection = connection
+
+    async def insert_many(self, entries: Sequence[AdminInboxEntry]) -> None:
+        await self._connection.execute(
+            insert(ADMIN_INBOX_TABLE),
+            [
+                {
+                    "task_id": entry.task_id,
+                    "assigned_admin": entry.assigned_admin,
+                    "created_at": entry.created_at,
+                    "expiration": entry.expiration,
+                    "content_type": entry.content_ref.content_type,
+                    "content_id": entry.content_ref.contnet_id,
+                }
+                for entry in entries
+            ],
+        )
+
+    async def reassign_many(self, assigned_admins: Mapping[TaskID, UserId]) -> None:
+        statement = (
+            update(ADMIN_INBOX_TABLE)
+            .where(ADMIN_INBOX_TABLE.c.task_id == bindparam("b_task_id"))
+            .values(assigned_admin=bindparam("b_assigned_admin"))
+        )
+        await self._connection.execute(
+            statement,
+            [
+                {"b_task_id": task_id, "b_assigned_admin": assigned_admin}
+                for task_id, assigned_admin in assigned_admins.items()
+            ],
+        )
+
+    async def delete_many(self, task_ids: Collection[TaskID]) -> None:
+        await self._connection.execute(
+            delete(ADMIN_INBOX_TABLE).where(ADMIN_INBOX_TABLE.c.task_id.in_(task_ids))
+        )
+
+    async def copy_pending_tasks(
+        self,
+        after: TaskID | None,
+        limit: int,
+    ) -> list[TaskID]:
+        pending_tasks = (
+            select(
+                MODERATION_TASKS_TABLE.c.task_id,
+                MODERATION_TASKS_TABLE.c.assigned_admin,
+                MODERATION_TASKS_TABLE.c.created_at,
+                MODERATION_TASKS_TABLE.c.expiration,
+                MODERATION_TASKS_TABLE.c.content_type,
+                MODERATION_TASKS_TABLE.c.content_id,
+            )
+            .where(MODERATION_TASKS_TABLE.c.decision == ModerationDecision.PENDING)
+            .order_by(MODERATION_TASKS_TABLE.c.task_id)
+            .limit(limit)
+        )
+
+        if after:
+            pending_tasks = pending_tasks.where(MODERATION_TASKS_TABLE.c.task_id > after)
+
+        cursor_result = await self._connection.execute(self._upsert_from(pending_tasks))
+
+        return sorted(TaskID(task_id) for task_id in cursor_result.scalars())
+
+    async def delete_stale(self, limit: int) -> int:
+        stale_task_ids = (
+            select(ADMIN_INBOX_TABLE.c.task_id)
+            .outerjoin(
+                MODERATION_TASKS_TABLE,
+                MODERATION_TASKS_TABLE.c.task_id == ADMIN_INBOX_TABLE.c.task_id,
+            )
+            .where(
+                or_(
+                    MODERATION_TASKS_TABLE.c.task_id.is_(None),
+                    MODERATION_TASKS_TABLE.c.decision != ModerationDecision.PENDING,
+                )
+            )
+            .limit(limit)
+        )
+        cursor_result = await self._connection.execute(
+            delete(ADMIN_INBOX_TABLE).where(
+                ADMIN_INBOX_TABLE.c.task_id.in_(stale_task_ids)
+            )
+        )
+
+        return cursor_result.rowcount
+
+    def _upsert_from(self, pending_tasks: Select) -> ReturningInsert[tuple[UUID]]:
+        insert_statement = (
+            postgresql_insert(ADMIN_INBOX_TABLE)
+            if self._connection.dialect.name == "postgresql"
+            else sqlite_insert(ADMIN_INBOX_TABLE)
+        ).from_select(
+            [column.name for column in pending_tasks.selected_columns],
+            pending_tasks,
+        )
+
+        return insert_statement.on_conflict_do_update(
+            index_elements=[ADMIN_INBOX_TABLE.c.task_id],
+            set_={"assigned_admin": insert_statement.excluded.assigned_admin},
+        ).returning(ADMIN_INBOX_TABLE.c.task_id)
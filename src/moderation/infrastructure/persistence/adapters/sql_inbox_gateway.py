@@ -0,0 +1,63 @@
+from collections.abc import Collection
+from datetime import datetime
+
+from sqlalchemy import CursorResult, delete, insert, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from moderation.infrastructure.inbox.inbox_gateway import InboxGateway
+from moderation.infrastructure.inbox.processed_message import ProcessedMessage
+from moderation.infrastructure.persistence.sql_tables import INBOX_TABLE
+
+
+class SqlInboxGateway(InboxGateway):
+    def __init__(self, connection: AsyncConnection) -> None:
+        self._connection = connection
+
+    async def find_processed(
+        self, messages: Collection[ProcessedMessage]
+    ) -> set[ProcessedMessage]:
+        statement = select(INBOX_TABLE.c.consumer, INBOX_TABLE.c.message_id).where(
+            tuple_(INBOX_TABLE.c.consumer, INBOX_TABLE.c.message_id).in_(
+                [(message.consumer, message.message_id) for message in messages]
+            )
+        )
+        cursor_rows = (await self._connection.execute(statement)).all()
+
+        return {
+            ProcessedMessage(
+                consumer=cursor_row.consumer, message_id=cursor_row.message_id
+            )
+            for cursor_row in cursor_rows
+        }
+
+    async def insert_many(
+        self, messages: Collection[ProcessedMessage], processed_at: datetime
+    ) -> None:
+        await self._connection.execute(
+            insert(INBOX_TABLE),
+            [
+                {
+                    "consumer": message.consumer,
+                    "message_id": message.message_id,
+                    "processed_at": processed_at,
+                }
+                for message in messages
+            ],
+        )
+
+    async def purge(self, *, processed_before: datetime, limit: int) -> int:
+        expired_messages = (
+            select(INBOX_TABLE.c.consumer, INBOX_TABLE.c.message_id)
+            .where(INBOX_TABLE.c.processed_at < processed_before)
+            .order_by(INBOX_TABLE.c.processed_at)
+            .limit(limit)
+        )
+        cursor_result: CursorResult = await self._connection.execute(
+            delete(INBOX_TABLE).where(
+                tuple_(INBOX_TABLE.c.consumer, INBOX_TABLE.c.message_id).in_(
+                    expired_messages
+                )
+            )
+        )
+
+        return cursor_result.rowcount
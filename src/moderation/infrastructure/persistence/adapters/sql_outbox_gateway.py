@@ -1,23 +1,65 @@
-from sqlalchemy import CursorResult, select
+from collections.abc import Sequence
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import CursorResult, and_, or_, select
 from sqlalchemy.ext.asyncio import AsyncConnection
 
 from moderation.infrastructure.outbox.outbox_gateway import OutboxGateway
 from moderation.infrastructure.outbox.outbox_message import OutboxMessage
-from moderation.infrastructure.persistence.sql_tables import OUTBOX_TABLE
+from moderation.infrastructure.persistence.sql_tables import (
+    OUTBOX_DEAD_LETTERS_TABLE,
+    OUTBOX_TABLE,
+)
 
 
 class SqlOutboxGateway(OutboxGateway):
     def __init__(self, connection: AsyncConnection) -> None:
         self._connection = connection
 
-    async def select(self) -> list[OutboxMessage]:
-        statement = select(
-            OUTBOX_TABLE.c.data.label("data"),
-            OUTBOX_TABLE.c.message_id.label("message_id"),
-            OUTBOX_TABLE.c.event_type.label("event_type"),
+    async def claim(
+        self,
+        *,
+        owner: UUID,
+        limit: int,
+        now: datetime,
+        lease_until: datetime,
+    ) -> list[OutboxMessage]:
+        # Postgres skips rows another relay is claiming right now; SQLite
+        # compiles FOR UPDATE away and relies on its single writer lock.
+        claimable = (
+            select(OUTBOX_TABLE.c.message_id)
+            .where(
+                and_(
+                    or_(
+                        OUTBOX_TABLE.c.lease_expires_at.is_(None),
+                        OUTBOX_TABLE.c.lease_expires_at < now,
+                    ),
+                    or_(
+                        OUTBOX_TABLE.c.next_attempt_at.is_(None),
+                        OUTBOX_TABLE.c.next_attempt_at <= now,
+                    ),
+                )
+            )
+            .order_by(OUTBOX_TABLE.c.message_id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        statement = (
+            OUTBOX_TABLE.update()
+            .where(OUTBOX_TABLE.c.message_id.in_(claimable.scalar_subquery()))
+            .values(lease_owner=owner, lease_expires_at=lease_until)
+            .returning(
+                OUTBOX_TABLE.c.data.label("data"),
+                OUTBOX_TABLE.c.message_id.label("message_id"),
+                OUTBOX_TABLE.c.event_type.label("event_type"),
+                OUTBOX_TABLE.c.attempts.label("attempts"),
+            )
         )
         cursor_result = await self._connection.execute(statement)
-        return self._load(cursor_result)
+        messages = self._load(cursor_result)
+        messages.sort(key=lambda message: message.message_id)
+        return messages
 
     async def insert(self, message: OutboxMessage) -> None:
         statement = OUTBOX_TABLE.insert().values(
@@ -27,18 +69,82 @@ class SqlOutboxGateway(OutboxGateway):
         )
         await self._connection.execute(statement)
 
+    async def insert_many(self, messages: Sequence[OutboxMessage]) -> None:
+        if not messages:
+            return
+
+        await self._connection.execute(
+            OUTBOX_TABLE.insert(),
+            [
+                {
+                    "data": message.data,
+                    "message_id": message.message_id,
+                    "event_type": message.event_type,
+                }
+                for message in messages
+            ],
+        )
+
+    async def reschedule(
+        self,
+        message: OutboxMessage,
+        *,
+        next_attempt_at: datetime,
+        error: str,
+    ) -> None:
+        statement = (
+            OUTBOX_TABLE.update()
+            .where(OUTBOX_TABLE.c.message_id == message.message_id)
+            .values(
+                attempts=OUTBOX_TABLE.c.attempts + 1,
+                next_attempt_at=next_attempt_at,
+                last_error=error,
+                lease_owner=None,
+                lease_expires_at=None,
+            )
+        )
+        await self._connection.execute(statement)
+
+    async def move_to_dead_letters(
+        self,
+        message: OutboxMessage,
+        *,
+        failed_at: datetime,
+        error: str,
+    ) -> None:
+        statement = OUTBOX_DEAD_LETTERS_TABLE.insert().values(
+            message_id=message.message_id,
+            data=message.data,
+            event_type=message.event_type,
+            attempts=message.attempts + 1,
+            last_error=error,
+            failed_at=failed_at,
+        )
+        await self._connection.execute(statement)
+        await self.delete(message)
+
     async def delete(self, message: OutboxMessage) -> None:
         statement = OUTBOX_TABLE.delete().where(
             OUTBOX_TABLE.c.message_id == message.message_id
         )
         await self._connection.execute(statement)
 
+    async def delete_many(self, messages: Sequence[OutboxMessage]) -> None:
+        if not messages:
+            return
+
+        statement = OUTBOX_TABLE.delete().where(
+            OUTBOX_TABLE.c.message_id.in_([message.message_id for message in messages])
+        )
+        await self._connection.execute(statement)
+
     def _load(self, cursor_result: CursorResult) -> list[OutboxMessage]:
         return [
             OutboxMessage(
                 data=cursor_row.data,
                 message_id=cursor_row.message_id,
                 event_type=cursor_row.event_type,
+                attempts=cursor_row.attempts,
             )
             for cursor_row in cursor_result
         ]
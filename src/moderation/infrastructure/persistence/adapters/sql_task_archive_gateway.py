@@ -0,0 +1,70 @@
+from datetime import datetime
+
+from sqlalchemy import CursorResult, delete, insert, select
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from moderation.domain.tasks.value_objects import ModerationDecision
+from moderation.infrastructure.archive.task_archive_gateway import TaskArchiveGateway
+from moderation.infrastructure.persistence.sql_tables import (
+    MODERATION_TASKS_ARCHIVE_TABLE,
+    MODERATION_TASKS_TABLE,
+)
+
+
+class SqlTaskArchiveGateway(TaskArchiveGateway):
+    def __init__(self, connection: AsyncConnection) -> None:
+        self._connection = connection
+
+    async def archive_decided(
+        self,
+        *,
+        created_before: datetime,
+        archived_at: datetime,
+        limit: int,
+    ) -> int:
+        statement = (
+            select(MODERATION_TASKS_TABLE)
+            .where(
+                MODERATION_TASKS_TABLE.c.decision != ModerationDecision.PENDING,
+                MODERATION_TASKS_TABLE.c.created_at < created_before,
+            )
+            .order_by(MODERATION_TASKS_TABLE.c.created_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        cursor_rows = (await self._connection.execute(statement)).all()
+
+        if not cursor_rows:
+            return 0
+
+        await self._connection.execute(
+            insert(MODERATION_TASKS_ARCHIVE_TABLE),
+            [
+                {**cursor_row._asdict(), "archived_at": archived_at}
+                for cursor_row in cursor_rows
+            ],
+        )
+        await self._connection.execute(
+            delete(MODERATION_TASKS_TABLE).where(
+                MODERATION_TASKS_TABLE.c.task_id.in_(
+                    [cursor_row.task_id for cursor_row in cursor_rows]
+                )
+            )
+        )
+
+        return len(cursor_rows)
+
+    async def purge_archived(self, *, archived_before: datetime, limit: int) -> int:
+        expired_task_ids = (
+            select(MODERATION_TASKS_ARCHIVE_TABLE.c.task_id)
+            .where(MODERATION_TASKS_ARCHIVE_TABLE.c.archived_at < archived_before)
+            .order_by(MODERATION_TASKS_ARCHIVE_TABLE.c.archived_at)
+            .limit(limit)
+        )
+        cursor_result: CursorResult = await self._connection.execute(
+            delete(MODERATION_TASKS_ARCHIVE_TABLE).where(
+                MODERATION_TASKS_ARCHIVE_TABLE.c.task_id.in_(expired_task_ids)
+            )
+        )
+
+        return cursor_result.rowcount
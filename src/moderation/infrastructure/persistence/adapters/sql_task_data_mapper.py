@@ -1,8 +1,28 @@
+from collections.abc import Callable, Collection, Sequence
+from operator import attrgetter
+from typing import Any
+
+from sqlalchemy import Insert, bindparam, select, tuple_
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncConnection
 
+from moderation.domain.tasks.exceptions import (
+    ModerationTaskAlreadyExistsError,
+    ModerationTaskIsReadyError,
+)
 from moderation.domain.tasks.task import ModerationTask
+from moderation.domain.tasks.value_objects import ModerationDecision
 from moderation.infrastructure.persistence.data_mapper import DataMapper
-from moderation.infrastructure.persistence.sql_tables import MODERATION_TASKS_TABLE
+from moderation.infrastructure.persistence.sql_tables import (
+    MODERATION_TASKS_ARCHIVE_TABLE,
+    MODERATION_TASKS_TABLE,
+)
+
+_UPDATABLE_FIELDS: dict[str, Callable[[ModerationTask], Any]] = {
+    "assigned_admin": attrgetter("assigned_admin"),
+    "decision": attrgetter("decision"),
+}
 
 
 class SqlModerationTaskDataMapper(DataMapper[ModerationTask]):
@@ -10,26 +30,123 @@ class SqlModerationTaskDataMapper(DataMapper[ModerationTask]):
         self._connection = connection
 
     async def insert(self, entity: ModerationTask) -> None:
-        stmt = MODERATION_TASKS_TABLE.insert().values(
-            task_id=entity.entity_id,
-            assigned_admin=entity.assigned_admin,
-            created_at=entity.created_at,
-            expiration=entity.expiration,
-            content_type=entity.content_ref.content_type,
-            content_id=entity.content_ref.contnet_id,
-            decision=entity.decision,
+        await self.insert_many([entity])
+
+    async def insert_many(self, entities: Sequence[ModerationTask]) -> None:
+        if not entities:
+            return
+
+        if await self._any_archived(entities):
+            raise ModerationTaskAlreadyExistsError
+
+        cursor_result = await self._connection.execute(
+            self._insert_ignoring_conflicts(),
+            [self._insert_values(entity) for entity in entities],
         )
 
-        await self._connection.execute(stmt)
+        if len(cursor_result.all()) != len(entities):
+            raise ModerationTaskAlreadyExistsError
+
+    async def _any_archived(self, entities: Sequence[ModerationTask]) -> bool:
+        statement = (
+            select(MODERATION_TASKS_ARCHIVE_TABLE.c.task_id)
+            .where(
+                tuple_(
+                    MODERATION_TASKS_ARCHIVE_TABLE.c.content_type,
+                    MODERATION_TASKS_ARCHIVE_TABLE.c.content_id,
+                ).in_(
+                    [
+                        (entity.content_ref.content_type, entity.content_ref.contnet_id)
+                        for entity in entities
+                    ]
+                )
+            )
+            .limit(1)
+        )
+        cursor_result = await self._connection.execute(statement)
+
+        return cursor_result.first() is not None
+
+    def _insert_ignoring_conflicts(self) -> Insert:
+        content_ref_columns = [
+            MODERATION_TASKS_TABLE.c.content_type,
+            MODERATION_TASKS_TABLE.c.content_id,
+        ]
+
+        if self._connection.dialect.name == "postgresql":
+            return (
+                postgresql_insert(MODERATION_TASKS_TABLE)
+                .on_conflict_do_nothing(index_elements=content_ref_columns)
+                .returning(MODERATION_TASKS_TABLE.c.task_id)
+            )
+
+        return (
+            sqlite_insert(MODERATION_TASKS_TABLE)
+            .on_conflict_do_nothing(index_elements=content_ref_columns)
+            .returning(MODERATION_TASKS_TABLE.c.task_id)
+        )
+
+    async def update(
+        self,
+        entity: ModerationTask,
+        fields: Collection[str],
+    ) -> None:
+        if not fields:
+            return
 
-    async def update(self, entity: ModerationTask) -> None:
         stmt = (
             MODERATION_TASKS_TABLE.update()
-            .where(MODERATION_TASKS_TABLE.c.task_id == entity.entity_id)
-            .values(assigned_admin=entity.assigned_admin, decision=entity.decision)
+            .where(
+                MODERATION_TASKS_TABLE.c.task_id == entity.entity_id,
+                MODERATION_TASKS_TABLE.c.decision == ModerationDecision.PENDING,
+            )
+            .values(
+                {field: _UPDATABLE_FIELDS[field](entity) for field in fields},
+            )
         )
 
-        await self._connection.execute(stmt)
+        cursor_result = await self._connection.execute(stmt)
+
+        if cursor_result.rowcount != 1:
+            raise ModerationTaskIsReadyError
+
+    async def update_many(
+        self,
+        entities: Sequence[ModerationTask],
+        fields: Collection[str],
+    ) -> None:
+        if not entities or not fields:
+            return
+
+        if not self._connection.dialect.supports_sane_multi_rowcount:
+            for entity in entities:
+                await self.update(entity, fields)
+            return
+
+        stmt = (
+            MODERATION_TASKS_TABLE.update()
+            .where(
+                MODERATION_TASKS_TABLE.c.task_id == bindparam("b_task_id"),
+                MODERATION_TASKS_TABLE.c.decision == ModerationDecision.PENDING,
+            )
+            .values({field: bindparam(f"b_{field}") for field in fields})
+        )
+
+        cursor_result = await self._connection.execute(
+            stmt,
+            [
+                {
+                    "b_task_id": entity.entity_id,
+                    **{
+                        f"b_{field}": _UPDATABLE_FIELDS[field](entity) for field in fields
+                    },
+                }
+                for entity in entities
+            ],
+        )
+
+        if cursor_result.rowcount != len(entities):
+            raise ModerationTaskIsReadyError
 
     async def delete(self, entity: ModerationTask) -> None:
         stmt = MODERATION_TASKS_TABLE.delete().where(
@@ -37,3 +154,26 @@ class SqlModerationTaskDataMapper(DataMapper[ModerationTask]):
         )
 
         await self._connection.execute(stmt)
+
+    async def delete_many(self, entities: Sequence[ModerationTask]) -> None:
+        if not entities:
+            return
+
+        stmt = MODERATION_TASKS_TABLE.delete().where(
+            MODERATION_TASKS_TABLE.c.task_id.in_(
+                [entity.entity_id for entity in entities]
+            )
+        )
+
+        await self._connection.execute(stmt)
+
+    def _insert_values(self, entity: ModerationTask) -> dict[str, Any]:
+        return {
+            "task_id": entity.entity_id,
+            "assigned_admin": entity.assigned_admin,
+            "created_at": entity.created_at,
+            "expiration": entity.expiration,
+            "content_type": entity.content_ref.content_type,
+            "content_id": entity.content_ref.contnet_id,
+            "decision": entity.decision,
+        }
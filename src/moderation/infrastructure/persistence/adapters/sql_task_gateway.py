@@ -1,48 +1,119 @@
 from collections.abc import Iterable
+from typing import Any
 
-from sqlalchemy import Row, select
-from sqlalchemy.ext.asyncio import AsyncConnection
+from sqlalchemy import CompoundSelect, Row, Select, literal, select, tuple_, union_all
 
 from moderation.application.models.moderation_task import ModerationTaskReadModel
-from moderation.application.models.pagination import Pagination
+from moderation.application.models.pagination import Pagination, TaskCursor
 from moderation.application.ports.task_gateway import ModerationTaskGateway
 from moderation.domain.shared.user_id import UserId
 from moderation.domain.tasks.task_id import TaskID
-from moderation.domain.tasks.value_objects import ContentRef
-from moderation.infrastructure.persistence.sql_tables import MODERATION_TASKS_TABLE
+from moderation.domain.tasks.value_objects import ContentRef, ModerationDecision
+from moderation.infrastructure.persistence.read_connection_factory import (
+    ReadConnectionFactory,
+)
+from moderation.infrastructure.persistence.sql_tables import (
+    ADMIN_INBOX_TABLE,
+    MODERATION_TASKS_ARCHIVE_TABLE,
+    MODERATION_TASKS_TABLE,
+)
 
 
 class SqlModerationTaskGateway(ModerationTaskGateway):
-    def __init__(self, connection: AsyncConnection) -> None:
-        self._connection = connection
+    def __init__(
+        self,
+        read_connection_factory: ReadConnectionFactory,
+        *,
+        serve_from_admin_inbox: bool = False,
+    ) -> None:
+        self._read_connection_factory = read_connection_factory
+        self._serve_from_admin_inbox = serve_from_admin_inbox
         self._identity_map: dict[TaskID, ModerationTaskReadModel] = {}
 
     async def load_admin_tasks(
-        self, admin_id: UserId, pagination: Pagination
+        self,
+        admin_id: UserId,
+        pagination: Pagination,
+        *,
+        include_archived: bool = False,
     ) -> Iterable[ModerationTaskReadModel]:
+        admin_tasks: Select[tuple[Any, ...]] | CompoundSelect = self._select_admin_tasks(
+            admin_id,
+            from_admin_inbox=self._serve_from_admin_inbox and not include_archived,
+        )
+
+        if include_archived:
+            admin_tasks = union_all(
+                admin_tasks,
+                self._select_archived_admin_tasks(admin_id),
+            )
+
+        tasks = admin_tasks.subquery()
         statement = (
-            select(
-                MODERATION_TASKS_TABLE.c.task_id.label("task_id"),
-                MODERATION_TASKS_TABLE.c.assigned_admin.label("assigned_admin"),
-                MODERATION_TASKS_TABLE.c.created_at.label("created_at"),
-                MODERATION_TASKS_TABLE.c.expiration.label("expiration"),
-                MODERATION_TASKS_TABLE.c.content_type.label("content_type"),
-                MODERATION_TASKS_TABLE.c.content_id.label("content_id"),
-                MODERATION_TASKS_TABLE.c.decision.label("decision"),
+            select(tasks)
+            .order_by(
+                tasks.c.created_at,
+                tasks.c.task_id,
             )
-            .where(MODERATION_TASKS_TABLE.c.assigned_admin == admin_id)
             .limit(pagination.limit)
-            .offset(pagination.offset)
         )
-        cursor_result = await self._connection.execute(statement)
+
+        if pagination.after:
+            cursor = TaskCursor.decode(pagination.after)
+            statement = statement.where(
+                tuple_(
+                    tasks.c.created_at,
+                    tasks.c.task_id,
+                )
+                > tuple_(
+                    literal(cursor.created_at, tasks.c.created_at.type),
+                    literal(cursor.task_id, tasks.c.task_id.type),
+                )
+            )
+        else:
+            statement = statement.offset(pagination.offset)
+
+        async with self._read_connection_factory.connect() as connection:
+            cursor_rows = (await connection.execute(statement)).all()
 
         moderation_tasks: list[ModerationTaskReadModel] = []
-        for cursor_row in cursor_result:
+        for cursor_row in cursor_rows:
             moderation_tasks.append(moderation_task := self._load(cursor_row))
             self._identity_map[moderation_task.task_id] = moderation_task
 
         return moderation_tasks
 
+    def _select_admin_tasks(
+        self, admin_id: UserId, *, from_admin_inbox: bool
+    ) -> Select[tuple[Any, ...]]:
+        tasks_table = ADMIN_INBOX_TABLE if from_admin_inbox else MODERATION_TASKS_TABLE
+        decision_column = (
+            literal(ModerationDecision.PENDING, MODERATION_TASKS_TABLE.c.decision.type)
+            if from_admin_inbox
+            else MODERATION_TASKS_TABLE.c.decision
+        )
+
+        return select(
+            tasks_table.c.task_id.label("task_id"),
+            tasks_table.c.assigned_admin.label("assigned_admin"),
+            tasks_table.c.created_at.label("created_at"),
+            tasks_table.c.expiration.label("expiration"),
+            tasks_table.c.content_type.label("content_type"),
+            tasks_table.c.content_id.label("content_id"),
+            decision_column.label("decision"),
+        ).where(tasks_table.c.assigned_admin == admin_id)
+
+    def _select_archived_admin_tasks(self, admin_id: UserId) -> Select[tuple[Any, ...]]:
+        return select(
+            MODERATION_TASKS_ARCHIVE_TABLE.c.task_id.label("task_id"),
+            MODERATION_TASKS_ARCHIVE_TABLE.c.assigned_admin.label("assigned_admin"),
+            MODERATION_TASKS_ARCHIVE_TABLE.c.created_at.label("created_at"),
+            MODERATION_TASKS_ARCHIVE_TABLE.c.expiration.label("expiration"),
+            MODERATION_TASKS_ARCHIVE_TABLE.c.content_type.label("content_type"),
+            MODERATION_TASKS_ARCHIVE_TABLE.c.content_id.label("content_id"),
+            MODERATION_TASKS_ARCHIVE_TABLE.c.decision.label("decision"),
+        ).where(MODERATION_TASKS_ARCHIVE_TABLE.c.assigned_admin == admin_id)
+
     def _load(self, cursor_row: Row) -> ModerationTaskReadModel:
         moderation_task = ModerationTaskReadModel(
             task_id=TaskID(cursor_row.task_id),
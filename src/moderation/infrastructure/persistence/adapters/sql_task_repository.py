@@ -1,6 +1,7 @@
-from collections.abc import Iterable
+from collections.abc import Collection, Iterable
+from typing import Any
 
-from sqlalchemy import Row, select
+from sqlalchemy import Row, Select, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncConnection
 
 from moderation.domain.shared.events import DomainEventAdder
@@ -10,7 +11,13 @@ from moderation.domain.tasks.repository import ModerationTaskRepository
 from moderation.domain.tasks.task import ModerationTask
 from moderation.domain.tasks.task_id import TaskID
 from moderation.domain.tasks.value_objects import ContentRef
-from moderation.infrastructure.persistence.sql_tables import MODERATION_TASKS_TABLE
+from moderation.infrastructure.persistence.entity_state_cache import (
+    EntityStateCache,
+)
+from moderation.infrastructure.persistence.sql_tables import (
+    MODERATION_TASKS_ARCHIVE_TABLE,
+    MODERATION_TASKS_TABLE,
+)
 
 
 class SqlModerationTaskRepository(ModerationTaskRepository):
@@ -19,8 +26,10 @@ class SqlModerationTaskRepository(ModerationTaskRepository):
         connection: AsyncConnection,
         event_adder: DomainEventAdder,
         unit_of_work: UnitOfWork,
+        task_cache: EntityStateCache,
     ) -> None:
         self._connection = connection
+        self._task_cache = task_cache
         self._unit_of_work = unit_of_work
         self._event_adder = event_adder
         self._identity_map: dict[TaskID, ModerationTask] = {}
@@ -37,6 +46,12 @@ class SqlModerationTaskRepository(ModerationTaskRepository):
         if task_id in self._identity_map:
             return self._identity_map[task_id]
 
+        cached_row = self._task_cache.get(task_id)
+        if cached_row is not None:
+            moderation_task = self._load(cached_row)
+            self._identity_map[task_id] = moderation_task
+            return moderation_task
+
         statement = select(
             MODERATION_TASKS_TABLE.c.task_id.label("task_id"),
             MODERATION_TASKS_TABLE.c.assigned_admin.label("assigned_admin"),
@@ -52,7 +67,11 @@ class SqlModerationTaskRepository(ModerationTaskRepository):
         if not cursor_row:
             return None
 
-        return self._load(cursor_row)
+        self._task_cache.put(task_id, cursor_row)
+        moderation_task = self._load(cursor_row)
+        self._identity_map[task_id] = moderation_task
+
+        return moderation_task
 
     async def with_assigned_admin(self, admin_id: UserId) -> Iterable[ModerationTask]:
         statement = select(
@@ -73,6 +92,120 @@ class SqlModerationTaskRepository(ModerationTaskRepository):
 
         return moderation_tasks
 
+    async def with_content_ref(self, content_ref: ContentRef) -> ModerationTask | None:
+        statement = select(
+            MODERATION_TASKS_TABLE.c.task_id.label("task_id"),
+            MODERATION_TASKS_TABLE.c.assigned_admin.label("assigned_admin"),
+            MODERATION_TASKS_TABLE.c.created_at.label("created_at"),
+            MODERATION_TASKS_TABLE.c.expiration.label("expiration"),
+            MODERATION_TASKS_TABLE.c.content_type.label("content_type"),
+            MODERATION_TASKS_TABLE.c.content_id.label("content_id"),
+            MODERATION_TASKS_TABLE.c.decision.label("decision"),
+        ).where(
+            MODERATION_TASKS_TABLE.c.content_type == content_ref.content_type,
+            MODERATION_TASKS_TABLE.c.content_id == content_ref.contnet_id,
+        )
+        cursor_result = await self._connection.execute(statement)
+        cursor_row = cursor_result.fetchone()
+
+        if not cursor_row:
+            archived_statement = (
+                self._select_archived_tasks()
+                .where(
+                    MODERATION_TASKS_ARCHIVE_TABLE.c.content_type
+                    == content_ref.content_type,
+                    MODERATION_TASKS_ARCHIVE_TABLE.c.content_id == content_ref.contnet_id,
+                )
+                .limit(1)
+            )
+            cursor_result = await self._connection.execute(archived_statement)
+            cursor_row = cursor_result.fetchone()
+
+        if not cursor_row:
+            return None
+
+        moderation_task = self._load(cursor_row)
+        self._identity_map[moderation_task.entity_id] = moderation_task
+
+        return moderation_task
+
+    async def with_content_refs(
+        self, content_refs: Collection[ContentRef]
+    ) -> Iterable[ModerationTask]:
+        if not content_refs:
+            return []
+
+        statement = select(
+            MODERATION_TASKS_TABLE.c.task_id.label("task_id"),
+            MODERATION_TASKS_TABLE.c.assigned_admin.label("assigned_admin"),
+            MODERATION_TASKS_TABLE.c.created_at.label("created_at"),
+            MODERATION_TASKS_TABLE.c.expiration.label("expiration"),
+            MODERATION_TASKS_TABLE.c.content_type.label("content_type"),
+            MODERATION_TASKS_TABLE.c.content_id.label("content_id"),
+            MODERATION_TASKS_TABLE.c.decision.label("decision"),
+        ).where(
+            tuple_(
+                MODERATION_TASKS_TABLE.c.content_type,
+                MODERATION_TASKS_TABLE.c.content_id,
+            ).in_(
+                [
+                    (content_ref.content_type, content_ref.contnet_id)
+                    for content_ref in content_refs
+                ]
+            )
+        )
+        cursor_result = await self._connection.execute(statement)
+
+        moderation_tasks: list[ModerationTask] = []
+        for cursor_row in cursor_result:
+            moderation_tasks.append(moderation_task := self._load(cursor_row))
+            self._identity_map[moderation_task.entity_id] = moderation_task
+
+        found_content_refs = {task.content_ref for task in moderation_tasks}
+        missing_content_refs = [
+            content_ref
+            for content_ref in content_refs
+            if content_ref not in found_content_refs
+        ]
+
+        if not missing_content_refs:
+            return moderation_tasks
+
+        archived_statement = self._select_archived_tasks().where(
+            tuple_(
+                MODERATION_TASKS_ARCHIVE_TABLE.c.content_type,
+                MODERATION_TASKS_ARCHIVE_TABLE.c.content_id,
+            ).in_(
+                [
+                    (content_ref.content_type, content_ref.contnet_id)
+                    for content_ref in missing_content_refs
+                ]
+            )
+        )
+        cursor_result = await self._connection.execute(archived_statement)
+
+        for cursor_row in cursor_result:
+            moderation_task = self._load(cursor_row)
+            if moderation_task.content_ref in found_content_refs:
+                continue
+
+            found_content_refs.add(moderation_task.content_ref)
+            moderation_tasks.append(moderation_task)
+            self._identity_map[moderation_task.entity_id] = moderation_task
+
+        return moderation_tasks
+
+    def _select_archived_tasks(self) -> Select[tuple[Any, ...]]:
+        return select(
+            MODERATION_TASKS_ARCHIVE_TABLE.c.task_id.label("task_id"),
+            MODERATION_TASKS_ARCHIVE_TABLE.c.assigned_admin.label("assigned_admin"),
+            MODERATION_TASKS_ARCHIVE_TABLE.c.created_at.label("created_at"),
+            MODERATION_TASKS_ARCHIVE_TABLE.c.expiration.label("expiration"),
+            MODERATION_TASKS_ARCHIVE_TABLE.c.content_type.label("content_type"),
+            MODERATION_TASKS_ARCHIVE_TABLE.c.content_id.label("content_id"),
+            MODERATION_TASKS_ARCHIVE_TABLE.c.decision.label("decision"),
+        )
+
     def _load(self, cursor_row: Row) -> ModerationTask:
         moderation_task = ModerationTask(
             entity_id=TaskID(cursor_row.task_id),
@@ -0,0 +1,20 @@
+from moderation.infrastructure.persistence.adapters.sqlite_writer import (
+    SqliteWriter,
+)
+from moderation.infrastructure.persistence.commit_executor import (
+    CommitExecutor,
+    Flush,
+)
+from moderation.infrastructure.persistence.transaction import Transaction
+
+
+class SqliteGroupCommitExecutor(CommitExecutor):
+    def __init__(self, sqlite_writer: SqliteWriter, transaction: Transaction) -> None:
+        self._sqlite_writer = sqlite_writer
+        self._transaction = transaction
+
+    async def execute(self, flush: Flush) -> None:
+        try:
+            await self._sqlite_writer.submit(flush)
+        finally:
+            await self._transaction.rollback()
@@ -0,0 +1,89 @@
+import asyncio
+from contextlib import suppress
+
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from moderation.infrastructure.persistence.commit_executor import Flush
+
+type WriteJob = tuple[Flush, asyncio.Future[None]]
+
+
+class SqliteWriter:
+    def __init__(self, connection: AsyncConnection, *, max_group_size: int) -> None:
+        self._connection = connection
+        self._max_group_size = max_group_size
+        self._queue: asyncio.Queue[WriteJob] = asyncio.Queue()
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def connection(self) -> AsyncConnection:
+        return self._connection
+
+    async def submit(self, flush: Flush) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((flush, future))
+        await future
+
+    async def close(self) -> None:
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._task
+
+    async def _run(self) -> None:
+        jobs: list[WriteJob] = []
+
+        try:
+            while True:
+                jobs = [await self._queue.get()]
+                while len(jobs) < self._max_group_size and not self._queue.empty():
+                    jobs.append(self._queue.get_nowait())
+
+                try:
+                    await self._commit_group(jobs)
+                except Exception as error:  # noqa: BLE001
+                    self._resolve(jobs, [error] * len(jobs))
+
+        except BaseException:
+            while not self._queue.empty():
+                jobs.append(self._queue.get_nowait())
+
+            for _, future in jobs:
+                future.cancel()
+            raise
+
+    async def _commit_group(self, jobs: list[WriteJob]) -> None:
+        errors: list[Exception | None] = []
+
+        try:
+            for flush, _ in jobs:
+                savepoint = await self._connection.begin_nested()
+                try:
+                    await flush()
+                except Exception as error:  # noqa: BLE001
+                    await savepoint.rollback()
+                    errors.append(error)
+                else:
+                    await savepoint.commit()
+                    errors.append(None)
+
+            await self._connection.commit()
+        except Exception as error:  # noqa: BLE001
+            errors = [error] * len(jobs)
+            await self._connection.rollback()
+
+        self._resolve(jobs, errors)
+
+    def _resolve(self, jobs: list[WriteJob], errors: list[Exception | None]) -> None:
+        for (_, future), job_error in zip(jobs, errors, strict=True):
+            if future.done():
+                continue
+            if job_error:
+                future.set_exception(job_error)
+            else:
+                future.set_result(None)
@@ -0,0 +1,18 @@
+from moderation.infrastructure.persistence.commit_executor import (
+    CommitExecutor,
+    Flush,
+)
+from moderation.infrastructure.persistence.transaction import Transaction
+
+
+class TransactionCommitExecutor(CommitExecutor):
+    def __init__(self, transaction: Transaction) -> None:
+        self._transaction = transaction
+
+    async def execute(self, flush: Flush) -> None:
+        try:
+            await flush()
+            await self._transaction.commit()
+        except Exception:
+            await self._transaction.rollback()
+            raise
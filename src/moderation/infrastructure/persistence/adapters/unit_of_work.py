@@ -1,73 +1,126 @@
+from collections import defaultdict
+from collections.abc import ItemsView
+from itertools import chain
+
 from moderation.application.ports.committer import Committer
 from moderation.domain.shared.entity import Entity
 from moderation.domain.shared.unit_of_work import UnitOfWork
+from moderation.infrastructure.admin_inbox.admin_inbox_buffer import AdminInboxBuffer
+from moderation.infrastructure.inbox.inbox_buffer import InboxBuffer
+from moderation.infrastructure.outbox.outbox_buffer import OutboxBuffer
+from moderation.infrastructure.outbox.outbox_notifier import OutboxNotifier
+from moderation.infrastructure.persistence.commit_executor import CommitExecutor
 from moderation.infrastructure.persistence.data_mappers_registry import (
     DataMappersRegistry,
 )
-from moderation.infrastructure.persistence.transaction import Transaction
+from moderation.infrastructure.persistence.entity_state_cache import (
+    EntityStateCache,
+)
 
 
 class UnitOfWorkImpl(Committer, UnitOfWork):
     def __init__(
         self,
-        transaction: Transaction,
+        commit_executor: CommitExecutor,
         data_mappers_registry: DataMappersRegistry,
+        outbox_buffer: OutboxBuffer,
+        outbox_notifier: OutboxNotifier,
+        admin_inbox_buffer: AdminInboxBuffer,
+        inbox_buffer: InboxBuffer,
+        entity_state_cache: EntityStateCache,
     ) -> None:
-        self._transaction = transaction
+        self._commit_executor = commit_executor
         self._data_mappers_registry = data_mappers_registry
+        self._outbox_buffer = outbox_buffer
+        self._admin_inbox_buffer = admin_inbox_buffer
+        self._inbox_buffer = inbox_buffer
+        self._outbox_notifier = outbox_notifier
+        self._entity_state_cache = entity_state_cache
 
         self._new_entities: list[Entity] = []
-        self._dirty_entities: list[Entity] = []
+        self._dirty_entities: dict[Entity, set[str]] = {}
         self._deleted_entities: list[Entity] = []
 
     def register_new(self, entity: Entity) -> None:
         self._new_entities.append(entity)
 
-    def register_dirty(self, entity: Entity) -> None:
-        self._dirty_entities.append(entity)
+    def register_dirty(self, entity: Entity, *fields: str) -> None:
+        self._dirty_entities.setdefault(entity, set()).update(fields)
 
     def register_deleted(self, entity: Entity) -> None:
         self._deleted_entities.append(entity)
 
     async def commit(self) -> None:
         try:
-            await self._persist_new()
-            await self._persist_dirty()
-            await self._persist_deleted()
-            await self._transaction.commit()
+            await self._commit_executor.execute(self._flush)
 
         except Exception:
-            await self._transaction.rollback()
+            self._outbox_buffer.discard()
+            self._outbox_notifier.discard()
+            self._admin_inbox_buffer.discard()
             raise
 
+        else:
+            self._inbox_buffer.committed()
+            self._outbox_notifier.notify()
+
         finally:
+            self._invalidate_cached_states()
             self._clear()
 
+    async def _flush(self) -> None:
+        await self._inbox_buffer.flush()
+        await self._persist_new()
+        await self._persist_dirty()
+        await self._persist_deleted()
+        await self._admin_inbox_buffer.flush()
+        await self._outbox_buffer.flush()
+
+    def _invalidate_cached_states(self) -> None:
+        for entity in chain(
+            self._new_entities, self._dirty_entities, self._deleted_entities
+        ):
+            self._entity_state_cache.invalidate(entity.entity_id)
+
     def _clear(self) -> None:
         self._new_entities.clear()
         self._dirty_entities.clear()
         self._deleted_entities.clear()
 
     async def _persist_new(self) -> None:
-        for entity in self._new_entities:
-            data_mapper = self._data_mappers_registry.get_mapper(
-                type(entity),
-            )
+        for entity_type, entities in self._group_by_type(self._new_entities):
+            data_mapper = self._data_mappers_registry.get_mapper(entity_type)
 
-            await data_mapper.insert(entity)
+            await data_mapper.insert_many(entities)
 
     async def _persist_dirty(self) -> None:
-        for entity in self._dirty_entities:
-            data_mapper = self._data_mappers_registry.get_mapper(
-                type(entity),
-            )
+        skipped = {*self._new_entities, *self._deleted_entities}
+        changes: dict[tuple[type[Entity], frozenset[str]], list[Entity]] = defaultdict(
+            list
+        )
+
+        for entity, fields in self._dirty_entities.items():
+            if fields and entity not in skipped:
+                changes[type(entity), frozenset(fields)].append(entity)
 
-            await data_mapper.update(entity)
+        for (entity_type, changed_fields), entities in changes.items():
+            data_mapper = self._data_mappers_registry.get_mapper(entity_type)
+
+            await data_mapper.update_many(entities, changed_fields)
 
     async def _persist_deleted(self) -> None:
-        for entity in self._deleted_entities:
-            data_mapper = self._data_mappers_registry.get_mapper(
-                type(entity),
-            )
+        for entity_type, entities in self._group_by_type(self._deleted_entities):
+            data_mapper = self._data_mappers_registry.get_mapper(entity_type)
+
+            await data_mapper.delete_many(entities)
+
+    def _group_by_type(
+        self,
+        entities: list[Entity],
+    ) -> ItemsView[type[Entity], list[Entity]]:
+        groups: dict[type[Entity], list[Entity]] = defaultdict(list)
+
+        for entity in entities:
+            groups[type(entity)].append(entity)
 
-            await data_mapper.delete(entity)
+        return groups.items()
@@ -0,0 +1,37 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+
+from moderation.infrastructure.persistence.transaction import Transaction
+
+type Batch = Callable[[int], Awaitable[int]]
+
+
+class BatchRunner:
+    def __init__(
+        self,
+        transaction: Transaction,
+        *,
+        batch_size: int,
+        batch_pause: float,
+    ) -> None:
+        self._transaction = transaction
+        self._batch_size = batch_size
+        self._batch_pause = batch_pause
+
+    async def run(self, batch: Batch) -> int:
+        processed = 0
+
+        while True:
+            try:
+                batch_processed = await batch(self._batch_size)
+                await self._transaction.commit()
+            except Exception:
+                await self._transaction.rollback()
+                raise
+
+            processed += batch_processed
+
+            if batch_processed < self._batch_size:
+                return processed
+
+            await asyncio.sleep(self._batch_pause)
@@ -0,0 +1,9 @@
+from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable
+
+type Flush = Callable[[], Awaitable[None]]
+
+
+class CommitExecutor(ABC):
+    @abstractmethod
+    async def execute(self, flush: Flush) -> None: ...
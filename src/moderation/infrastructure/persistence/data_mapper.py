@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import Collection, Sequence
 
 from moderation.domain.shared.entity import Entity
 
@@ -7,6 +8,16 @@ class DataMapper[T: Entity](ABC):
     @abstractmethod
     async def insert(self, entity: T) -> None: ...
     @abstractmethod
-    async def update(self, entity: T) -> None: ...
+    async def insert_many(self, entities: Sequence[T]) -> None: ...
+    @abstractmethod
+    async def update(self, entity: T, fields: Collection[str]) -> None: ...
+    @abstractmethod
+    async def update_many(
+        self,
+        entities: Sequence[T],
+        fields: Collection[str],
+    ) -> None: ...
     @abstractmethod
     async def delete(self, entity: T) -> None: ...
+    @abstractmethod
+    async def delete_many(self, entities: Sequence[T]) -> None: ...
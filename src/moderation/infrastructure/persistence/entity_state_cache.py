@@ -0,0 +1,65 @@
+from collections import OrderedDict
+from collections.abc import Hashable
+from dataclasses import dataclass
+from time import monotonic
+from typing import Any
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    size: int
+    max_size: int
+    hits: int
+    misses: int
+    evictions: int
+
+
+class EntityStateCache:
+    def __init__(self, *, max_size: int, ttl: float) -> None:
+        self._max_size = max_size
+        self._ttl = ttl
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, entity_id: Hashable) -> Any | None:
+        entry = self._entries.get(entity_id)
+
+        if entry is None:
+            self._misses += 1
+            return None
+
+        expires_at, state = entry
+        if expires_at <= monotonic():
+            del self._entries[entity_id]
+            self._misses += 1
+            self._evictions += 1
+            return None
+
+        self._entries.move_to_end(entity_id)
+        self._hits += 1
+        return state
+
+    def put(self, entity_id: Hashable, state: Any) -> None:
+        if self._max_size <= 0:
+            return
+
+        self._entries[entity_id] = (monotonic() + self._ttl, state)
+        self._entries.move_to_end(entity_id)
+
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def invalidate(self, entity_id: Hashable) -> None:
+        self._entries.pop(entity_id, None)
+
+    def stats(self) -> CacheStats:
+        return CacheStats(
+            size=len(self._entries),
+            max_size=self._max_size,
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+        )
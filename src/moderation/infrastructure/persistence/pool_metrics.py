@@ -0,0 +1,47 @@
+from dataclasses import dataclass
+
+from sqlalchemy import QueuePool
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    pool_size: int
+    checked_out: int
+    overflow: int
+    checkouts: int
+    checkout_wait_total: float
+    checkout_wait_max: float
+
+
+class PoolMetrics:
+    def __init__(self, engine: AsyncEngine) -> None:
+        self._engine = engine
+        self._checkouts = 0
+        self._checkout_wait_total = 0.0
+        self._checkout_wait_max = 0.0
+
+    def record_checkout(self, wait: float) -> None:
+        self._checkouts += 1
+        self._checkout_wait_total += wait
+        self._checkout_wait_max = max(self._checkout_wait_max, wait)
+
+    def stats(self) -> PoolStats:
+        pool = self._engine.pool
+        pool_size, checked_out, overflow = 0, 0, 0
+
+        if isinstance(pool, QueuePool):
+            pool_size, checked_out, overflow = (
+                pool.size(),
+                pool.checkedout(),
+                pool.overflow(),
+            )
+
+        return PoolStats(
+            pool_size=pool_size,
+            checked_out=checked_out,
+            overflow=overflow,
+            checkouts=self._checkouts,
+            checkout_wait_total=self._checkout_wait_total,
+            checkout_wait_max=self._checkout_wait_max,
+        )
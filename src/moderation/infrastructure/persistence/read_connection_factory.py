@@ -0,0 +1,26 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from time import monotonic
+
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from moderation.infrastructure.persistence.pool_metrics import PoolMetrics
+
+
+class ReadConnectionFactory:
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        pool_metrics: PoolMetrics | None = None,
+    ) -> None:
+        self._engine = engine
+        self._pool_metrics = pool_metrics
+
+    @asynccontextmanager
+    async def connect(self) -> AsyncIterator[AsyncConnection]:
+        checkout_started_at = monotonic()
+        async with self._engine.connect() as connection:
+            if self._pool_metrics:
+                self._pool_metrics.record_checkout(monotonic() - checkout_started_at)
+
+            yield await connection.execution_options(isolation_level="AUTOCOMMIT")
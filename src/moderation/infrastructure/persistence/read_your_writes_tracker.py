@@ -0,0 +1,24 @@
+from time import monotonic
+
+from moderation.domain.shared.user_id import UserId
+
+
+class ReadYourWritesTracker:
+    def __init__(self, window: float) -> None:
+        self._window = window
+        self._pinned_until: dict[UserId, float] = {}
+
+    def record_write(self, user_id: UserId) -> None:
+        now = monotonic()
+        self._pinned_until[user_id] = now + self._window
+
+        if len(self._pinned_until) > 1024:
+            self._pinned_until = {
+                pinned_user_id: pinned_until
+                for pinned_user_id, pinned_until in self._pinned_until.items()
+                if pinned_until > now
+            }
+
+    def is_pinned(self, user_id: UserId) -> bool:
+        pinned_until = self._pinned_until.get(user_id)
+        return pinned_until is not None and pinned_until > monotonic()
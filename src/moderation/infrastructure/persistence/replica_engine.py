@@ -0,0 +1,5 @@
+from typing import NewType
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+ReplicaEngine = NewType("ReplicaEngine", AsyncEngine)
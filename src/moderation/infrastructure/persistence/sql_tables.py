@@ -3,6 +3,8 @@ from sqlalchemy import (
     Column,
     DateTime,
     Enum,
+    Index,
+    Integer,
     MetaData,
     Table,
     Text,
@@ -27,6 +29,81 @@ MODERATION_TASKS_TABLE = Table(
         nullable=False,
         default=ModerationDecision.PENDING,
     ),
+    Index(
+        "ix_moderation_tasks_assigned_admin_created_at",
+        "assigned_admin",
+        "created_at",
+        "task_id",
+    ),
+    Index(
+        "ix_moderation_tasks_assigned_admin_decision",
+        "assigned_admin",
+        "decision",
+    ),
+    Index(
+        "uq_moderation_tasks_content_type_content_id",
+        "content_type",
+        "content_id",
+        unique=True,
+    ),
+)
+
+Index(
+    "ix_moderation_tasks_pending_expiration",
+    MODERATION_TASKS_TABLE.c.expiration,
+    postgresql_where=MODERATION_TASKS_TABLE.c.decision == ModerationDecision.PENDING,
+    sqlite_where=MODERATION_TASKS_TABLE.c.decision == ModerationDecision.PENDING,
+)
+
+Index(
+    "ix_moderation_tasks_decided_created_at",
+    MODERATION_TASKS_TABLE.c.created_at,
+    postgresql_where=MODERATION_TASKS_TABLE.c.decision != ModerationDecision.PENDING,
+    sqlite_where=MODERATION_TASKS_TABLE.c.decision != ModerationDecision.PENDING,
+)
+
+
+MODERATION_TASKS_ARCHIVE_TABLE = Table(
+    "moderation_tasks_archive",
+    METADATA,
+    Column("task_id", UUID, primary_key=True),
+    Column("assigned_admin", UUID, nullable=False),
+    Column("created_at", DateTime(timezone=True), nullable=False),
+    Column("expiration", DateTime(timezone=True), nullable=False),
+    Column("content_type", Enum(ContentType), nullable=False),
+    Column("content_id", UUID, nullable=False),
+    Column("decision", Enum(ModerationDecision), nullable=False),
+    Column("archived_at", DateTime(timezone=True), nullable=False),
+    Index(
+        "ix_moderation_tasks_archive_assigned_admin_created_at",
+        "assigned_admin",
+        "created_at",
+        "task_id",
+    ),
+    Index("ix_moderation_tasks_archive_archived_at", "archived_at"),
+    Index(
+        "ix_moderation_tasks_archive_content_type_content_id",
+        "content_type",
+        "content_id",
+    ),
+)
+
+
+ADMIN_INBOX_TABLE = Table(
+    "admin_inbox",
+    METADATA,
+    Column("task_id", UUID, primary_key=True),
+    Column("assigned_admin", UUID, nullable=False),
+    Column("created_at", DateTime(timezone=True), nullable=False),
+    Column("expiration", DateTime(timezone=True), nullable=False),
+    Column("content_type", Enum(ContentType), nullable=False),
+    Column("content_id", UUID, nullable=False),
+    Index(
+        "ix_admin_inbox_assigned_admin_created_at",
+        "assigned_admin",
+        "created_at",
+        "task_id",
+    ),
 )
 
 
@@ -36,4 +113,31 @@ OUTBOX_TABLE = Table(
     Column("message_id", UUID, primary_key=True),
     Column("data", Text, nullable=False),
     Column("event_type", Text, nullable=False, default=False),
+    Column("lease_owner", UUID, nullable=True),
+    Column("lease_expires_at", DateTime(timezone=True), nullable=True),
+    Column("attempts", Integer, nullable=False, default=0, server_default="0"),
+    Column("next_attempt_at", DateTime(timezone=True), nullable=True),
+    Column("last_error", Text, nullable=True),
+)
+
+
+OUTBOX_DEAD_LETTERS_TABLE = Table(
+    "outbox_dead_letters",
+    METADATA,
+    Column("message_id", UUID, primary_key=True),
+    Column("data", Text, nullable=False),
+    Column("event_type", Text, nullable=False),
+    Column("attempts", Integer, nullable=False),
+    Column("last_error", Text, nullable=True),
+    Column("failed_at", DateTime(timezone=True), nullable=False),
+)
+
+
+INBOX_TABLE = Table(
+    "inbox",
+    METADATA,
+    Column("consumer", Text, primary_key=True),
+    Column("message_id", Text, primary_key=True),
+    Column("processed_at", DateTime(timezone=True), nullable=False),
+    Index("ix_inbox_processed_at", "processed_at"),
 )
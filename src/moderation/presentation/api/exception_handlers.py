@@ -15,7 +15,10 @@ from moderation.application.common.application_error import (
     ErrorType,
 )
 from moderation.domain.shared.exceptions import DomainError
-from moderation.domain.tasks.exceptions import ModerationTaskIsReadyError
+from moderation.domain.tasks.exceptions import (
+    ModerationTaskAlreadyExistsError,
+    ModerationTaskIsReadyError,
+)
 from moderation.presentation.api.response_models import ErrorData, ErrorResponse
 
 STATUS_MAP = {
@@ -24,6 +27,7 @@ STATUS_MAP = {
     ErrorType.APPLICATION_ERROR: HTTP_500_INTERNAL_SERVER_ERROR,
     ErrorType.PERMISSION_ERROR: HTTP_403_FORBIDDEN,
     ModerationTaskIsReadyError: HTTP_409_CONFLICT,
+    ModerationTaskAlreadyExistsError: HTTP_409_CONFLICT,
 }
 
 
@@ -0,0 +1,51 @@
+from dataclasses import dataclass
+
+from dishka import FromDishka
+from dishka.integrations.fastapi import inject
+from fastapi import APIRouter
+from starlette.status import HTTP_200_OK
+
+from moderation.infrastructure.inbox.processed_message_filter import (
+    InboxStats,
+    ProcessedMessageFilter,
+)
+from moderation.infrastructure.persistence.entity_state_cache import (
+    CacheStats,
+    EntityStateCache,
+)
+from moderation.infrastructure.persistence.pool_metrics import (
+    PoolMetrics,
+    PoolStats,
+)
+from moderation.presentation.api.response_models import SuccessResponse
+
+METRICS_ROUTER = APIRouter(tags=["Metrics"])
+
+
+@dataclass(frozen=True)
+class Metrics:
+    task_cache: CacheStats
+    database_pool: PoolStats
+    inbox: InboxStats
+
+
+@METRICS_ROUTER.get(
+    "/metrics",
+    responses={HTTP_200_OK: {"model": SuccessResponse[Metrics]}},
+    status_code=HTTP_200_OK,
+)
+@inject
+async def metrics(
+    *,
+    task_cache: FromDishka[EntityStateCache],
+    pool_metrics: FromDishka[PoolMetrics],
+    processed_message_filter: FromDishka[ProcessedMessageFilter],
+) -> SuccessResponse[Metrics]:
+    return SuccessResponse(
+        status=HTTP_200_OK,
+        result=Metrics(
+            task_cache=task_cache.stats(),
+            database_pool=pool_metrics.stats(),
+            inbox=processed_message_filter.stats(),
+        ),
+    )
@@ -4,7 +4,7 @@ from typing import Annotated
 from bazario.asyncio import Sender
 from dishka import FromDishka
 from dishka.integrations.fastapi import inject
-from fastapi import APIRouter, Body, Depends
+from fastapi import APIRouter, Body, Depends, Response
 from starlette.status import (
     HTTP_200_OK,
     HTTP_403_FORBIDDEN,
@@ -14,7 +14,7 @@ from starlette.status import (
 
 from moderation.application.common.application_error import ApplicationError
 from moderation.application.models.moderation_task import ModerationTaskReadModel
-from moderation.application.models.pagination import Pagination
+from moderation.application.models.pagination import Pagination, TaskCursor
 from moderation.application.operations.read.get_my_tasks import LoadMyTasks
 from moderation.application.operations.write.provide_decision import (
     ProvideDecision,
@@ -27,6 +27,7 @@ from moderation.presentation.api.response_models import (
 )
 
 MODERATION_TASKS_ROUTER = APIRouter(prefix="/moderation-tasks", tags=["moderation-tasks"])
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
 
 
 @MODERATION_TASKS_ROUTER.put(
@@ -60,8 +61,20 @@ async def provide_decision(
 @inject
 async def load_my_tasks(
     pagination: Annotated[Pagination, Depends()],
+    response: Response,
+    include_archived: bool = False,
     *,
     sender: FromDishka[Sender],
 ) -> SuccessResponse[Iterable[ModerationTaskReadModel]]:
-    tasks = await sender.send(LoadMyTasks(pagintation=pagination))
+    tasks = list(
+        await sender.send(
+            LoadMyTasks(pagintation=pagination, include_archived=include_archived)
+        )
+    )
+
+    if tasks and len(tasks) == pagination.limit:
+        last_task = tasks[-1]
+        next_cursor = TaskCursor(last_task.created_at, last_task.task_id)
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor.encode()
+
     return SuccessResponse(status=HTTP_200_OK, result=tasks)
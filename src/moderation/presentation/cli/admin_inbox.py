@@ -0,0 +1,29 @@
+import asyncio
+
+from click import option
+from dishka import AsyncContainer, FromDishka
+from dishka.integrations.click import inject
+
+from moderation.infrastructure.admin_inbox.admin_inbox_rebuilder import (
+    AdminInboxRebuilder,
+)
+
+
+async def _rebuild_admin_inbox(container: AsyncContainer, batch_size: int) -> int:
+    try:
+        async with container() as request_container:
+            admin_inbox_rebuilder = await request_container.get(AdminInboxRebuilder)
+            return await admin_inbox_rebuilder.rebuild(batch_size)
+    finally:
+        await container.close()
+
+
+@option("--batch_size", "-b", type=int, default=1000)
+@inject
+def rebuild_admin_inbox(
+    batch_size: int,
+    *,
+    worker_container: FromDishka[AsyncContainer],
+) -> None:
+    copied = asyncio.run(_rebuild_admin_inbox(worker_container, batch_size))
+    print(f"Admin inbox rebuilt with {copied} pending tasks")
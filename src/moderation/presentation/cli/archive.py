@@ -0,0 +1,21 @@
+import asyncio
+
+from dishka import AsyncContainer, FromDishka
+from dishka.integrations.click import inject
+
+from moderation.infrastructure.archive.task_archiver import TaskArchiver
+
+
+async def _archive(container: AsyncContainer) -> tuple[int, int]:
+    try:
+        async with container() as request_container:
+            task_archiver = await request_container.get(TaskArchiver)
+            return await task_archiver.archive(), await task_archiver.purge()
+    finally:
+        await container.close()
+
+
+@inject
+def archive(*, worker_container: FromDishka[AsyncContainer]) -> None:
+    archived, purged = asyncio.run(_archive(worker_container))
+    print(f"Archived {archived} decided tasks, purged {purged} archived tasks")
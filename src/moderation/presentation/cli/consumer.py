@@ -0,0 +1,48 @@
+import asyncio
+import multiprocessing
+from typing import Protocol
+
+from click import option
+from dishka import FromDishka
+from dishka.integrations.click import inject
+from faststream import FastStream
+
+
+class StreamApplicationFactory(Protocol):
+    def __call__(self) -> FastStream: ...
+
+
+def _run_stream(stream_application_factory: StreamApplicationFactory) -> None:
+    asyncio.run(stream_application_factory().run())
+
+
+@option("--processes", "-p", type=int, default=1)
+@inject
+def consume(
+    processes: int,
+    *,
+    stream_application_factory: FromDishka[StreamApplicationFactory],
+) -> None:
+    if processes <= 1:
+        _run_stream(stream_application_factory)
+        return
+
+    spawn_context = multiprocessing.get_context("spawn")
+    consumer_processes = [
+        spawn_context.Process(
+            target=_run_stream,
+            args=(stream_application_factory,),
+            name=f"moderation-consumer-{number}",
+        )
+        for number in range(processes)
+    ]
+
+    for consumer_process in consumer_processes:
+        consumer_process.start()
+
+    try:
+        for consumer_process in consumer_processes:
+            consumer_process.join()
+    except KeyboardInterrupt:
+        for consumer_process in consumer_processes:
+            consumer_process.join()
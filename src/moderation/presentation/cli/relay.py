@@ -0,0 +1,10 @@
+import asyncio
+
+from dishka import FromDishka
+from dishka.integrations.click import inject
+from faststream import FastStream
+
+
+@inject
+def start_relay(*, outbox_relay_application: FromDishka[FastStream]) -> None:
+    asyncio.run(outbox_relay_application.run())
@@ -0,0 +1,27 @@
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from faststream import BaseMiddleware, context
+from faststream.broker.message import StreamMessage
+
+from moderation.presentation.stream.concurrency_limiter import (
+    ConsumerConcurrencyLimiters,
+)
+
+
+class ConcurrencyLimitMiddleware(BaseMiddleware):
+    def __init__(self, consumer: str, msg: Any | None = None) -> None:
+        super().__init__(msg)
+        self._consumer = consumer
+
+    async def consume_scope(
+        self,
+        call_next: Callable[[Any], Awaitable[Any]],
+        msg: StreamMessage[Any],
+    ) -> Any:
+        limiters: ConsumerConcurrencyLimiters = await context.get_local("dishka").get(
+            ConsumerConcurrencyLimiters
+        )
+
+        async with limiters.acquire(self._consumer):
+            return await call_next(msg)
@@ -0,0 +1,122 @@
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from time import monotonic
+
+from moderation.infrastructure.persistence.pool_metrics import PoolMetrics
+
+
+class AdaptiveConcurrencyLimiter:
+    def __init__(
+        self,
+        pool_metrics: PoolMetrics,
+        *,
+        min_limit: int,
+        max_limit: int,
+        target_checkout_wait: float,
+        adjust_interval: float,
+    ) -> None:
+        self._pool_metrics = pool_metrics
+        self._min_limit = min_limit
+        self._max_limit = max_limit
+        self._target_checkout_wait = target_checkout_wait
+        self._adjust_interval = adjust_interval
+
+        self._limit = max_limit
+        self._in_flight = 0
+        self._slot_released = asyncio.Condition()
+
+        stats = pool_metrics.stats()
+        self._sampled_at = monotonic()
+        self._sampled_checkouts = stats.checkouts
+        self._sampled_checkout_wait_total = stats.checkout_wait_total
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[None]:
+        async with self._slot_released:
+            await self._slot_released.wait_for(lambda: self._in_flight < self._limit)
+            self._in_flight += 1
+
+        try:
+            yield
+        finally:
+            async with self._slot_released:
+                self._in_flight -= 1
+                self._adjust()
+                self._slot_released.notify(self._limit - self._in_flight)
+
+    def _adjust(self) -> None:
+        now = monotonic()
+
+        if now - self._sampled_at < self._adjust_interval:
+            return
+
+        stats = self._pool_metrics.stats()
+        checkouts = stats.checkouts - self._sampled_checkouts
+        checkout_wait = stats.checkout_wait_total - self._sampled_checkout_wait_total
+
+        self._sampled_at = now
+        self._sampled_checkouts = stats.checkouts
+        self._sampled_checkout_wait_total = stats.checkout_wait_total
+
+        if not checkouts:
+            return
+
+        if checkout_wait / checkouts > self._target_checkout_wait:
+            self._limit = max(self._min_limit, min(self._limit - 1, self._limit * 3 // 4))
+        else:
+            self._limit = min(self._max_limit, self._limit + max(1, self._limit // 10))
+
+
+class ConsumerConcurrencyLimiters:
+    def __init__(
+        self,
+        pool_metrics: PoolMetrics,
+        *,
+        max_in_flight: int,
+        consumer_concurrency: int,
+        min_consumer_concurrency: int,
+        target_checkout_wait: float,
+        adjust_interval: float,
+    ) -> None:
+        self._pool_metrics = pool_metrics
+        self._consumer_concurrency = consumer_concurrency
+        self._min_consumer_concurrency = min_consumer_concurrency
+        self._target_checkout_wait = target_checkout_wait
+        self._adjust_interval = adjust_interval
+
+        self.total = AdaptiveConcurrencyLimiter(
+            pool_metrics,
+            min_limit=max_in_flight,
+            max_limit=max_in_flight,
+            target_checkout_wait=target_checkout_wait,
+            adjust_interval=adjust_interval,
+        )
+        self._consumers: dict[str, AdaptiveConcurrencyLimiter] = {}
+
+    def for_consumer(self, consumer: str) -> AdaptiveConcurrencyLimiter:
+        limiter = self._consumers.get(consumer)
+
+        if limiter is None:
+            limiter = self._consumers[consumer] = AdaptiveConcurrencyLimiter(
+                self._pool_metrics,
+                min_limit=self._min_consumer_concurrency,
+                max_limit=self._consumer_concurrency,
+                target_checkout_wait=self._target_checkout_wait,
+                adjust_interval=self._adjust_interval,
+            )
+
+        return limiter
+
+    @asynccontextmanager
+    async def acquire(self, consumer: str) -> AsyncIterator[None]:
+        async with self.for_consumer(consumer).acquire(), self.total.acquire():
+            yield
@@ -1,16 +1,24 @@
 from enum import StrEnum
+from typing import NewType
 
 from bazario.asyncio import Sender
 from dishka import FromDishka
 from dishka.integrations.faststream import inject
 from faststream.rabbit import ExchangeType, RabbitExchange, RabbitQueue
+from faststream.rabbit.annotations import RabbitMessage
 from faststream.rabbit.router import RabbitRouter
 
 from moderation.application.operations.write.moderate_content import (
     ModerateContent,
 )
+from moderation.domain.tasks.exceptions import ModerationTaskAlreadyExistsError
 from moderation.domain.tasks.task_id import TaskID
 from moderation.domain.tasks.value_objects import ContentType
+from moderation.infrastructure.inbox.inbox_buffer import InboxBuffer
+from moderation.presentation.stream.content_moderation_batcher import (
+    ContentModerationBatcher,
+)
+from moderation.presentation.stream.inbox_middleware import to_processed_message
 from moderation.presentation.stream.request_models import (
     MeetupCreated,
 )
@@ -20,23 +28,47 @@ class ExchangeName(StrEnum):
     MEETUPS = "meetups_exchange"
 
 
+MEETUPS_EXCHANGE = RabbitExchange(
+    name=ExchangeName.MEETUPS, type=ExchangeType.DIRECT, durable=True
+)
+CREATED_MEETUPS_QUEUE = RabbitQueue(
+    name="created_meetups", durable=True, routing_key="MeetupCreated"
+)
+
 MEETUPS_ROUTER = RabbitRouter()
+BATCHED_MEETUPS_ROUTER = RabbitRouter()
 
+MeetupModerationBatcher = NewType("MeetupModerationBatcher", ContentModerationBatcher)
 
-@MEETUPS_ROUTER.subscriber(
-    queue=RabbitQueue(name="created_meetups", durable=True, routing_key="MeetupCreated"),
-    exchange=RabbitExchange(
-        name=ExchangeName.MEETUPS, type=ExchangeType.DIRECT, durable=True
-    ),
-)
+
+@MEETUPS_ROUTER.subscriber(queue=CREATED_MEETUPS_QUEUE, exchange=MEETUPS_EXCHANGE)
 @inject
 async def start_meetup_moderation(
-    event: MeetupCreated, *, sender: FromDishka[Sender]
+    event: MeetupCreated,
+    message: RabbitMessage,
+    *,
+    sender: FromDishka[Sender],
+    inbox_buffer: FromDishka[InboxBuffer],
 ) -> TaskID:
-    taski_id = await sender.send(
-        request=ModerateContent(
-            content_type=ContentType.MEETUP, content_id=event.meetup_id
-        )
-    )
+    if processed_message := to_processed_message(CREATED_MEETUPS_QUEUE.name, message):
+        inbox_buffer.add(processed_message)
 
-    return taski_id
+    command = ModerateContent(content_type=ContentType.MEETUP, content_id=event.meetup_id)
+
+    try:
+        return await sender.send(request=command)
+    except ModerationTaskAlreadyExistsError:
+        return await sender.send(request=command)
+
+
+@BATCHED_MEETUPS_ROUTER.subscriber(queue=CREATED_MEETUPS_QUEUE, exchange=MEETUPS_EXCHANGE)
+@inject
+async def start_batched_meetup_moderation(
+    event: MeetupCreated,
+    message: RabbitMessage,
+    *,
+    meetup_moderation_batcher: FromDishka[MeetupModerationBatcher],
+) -> TaskID:
+    return await meetup_moderation_batcher.submit(
+        (event.meetup_id, to_processed_message(CREATED_MEETUPS_QUEUE.name, message))
+    )
@@ -0,0 +1,68 @@
+from typing import NewType
+
+from bazario.asyncio import Sender
+from dishka import FromDishka
+from dishka.integrations.faststream import inject
+from faststream.rabbit import RabbitQueue
+from faststream.rabbit.annotations import RabbitMessage
+from faststream.rabbit.router import RabbitRouter
+
+from moderation.application.operations.write.moderate_content import (
+    ModerateContent,
+)
+from moderation.domain.tasks.exceptions import ModerationTaskAlreadyExistsError
+from moderation.domain.tasks.task_id import TaskID
+from moderation.domain.tasks.value_objects import ContentType
+from moderation.infrastructure.inbox.inbox_buffer import InboxBuffer
+from moderation.presentation.stream.consumers.meetups import MEETUPS_EXCHANGE
+from moderation.presentation.stream.content_moderation_batcher import (
+    ContentModerationBatcher,
+)
+from moderation.presentation.stream.inbox_middleware import to_processed_message
+from moderation.presentation.stream.request_models import (
+    ReviewAdded,
+)
+
+ADDED_REVIEWS_QUEUE = RabbitQueue(
+    name="added_reviews", durable=True, routing_key="ReviewAdded"
+)
+
+REVIEWS_ROUTER = RabbitRouter()
+BATCHED_REVIEWS_ROUTER = RabbitRouter()
+
+ReviewModerationBatcher = NewType("ReviewModerationBatcher", ContentModerationBatcher)
+
+
+@REVIEWS_ROUTER.subscriber(queue=ADDED_REVIEWS_QUEUE, exchange=MEETUPS_EXCHANGE)
+@inject
+async def start_review_moderation(
+    event: ReviewAdded,
+    message: RabbitMessage,
+    *,
+    sender: FromDishka[Sender],
+    inbox_buffer: FromDishka[InboxBuffer],
+) -> TaskID:
+    if processed_message := to_processed_message(ADDED_REVIEWS_QUEUE.name, message):
+        inbox_buffer.add(processed_message)
+
+    command = ModerateContent(
+        content_type=ContentType.MEETUP_REVIEW, content_id=event.review_id
+    )
+
+    try:
+        return await sender.send(request=command)
+    except ModerationTaskAlreadyExistsError:
+        return await sender.send(request=command)
+
+
+@BATCHED_REVIEWS_ROUTER.subscriber(queue=ADDED_REVIEWS_QUEUE, exchange=MEETUPS_EXCHANGE)
+@inject
+async def start_batched_review_moderation(
+    event: ReviewAdded,
+    message: RabbitMessage,
+    *,
+    review_moderation_batcher: FromDishka[ReviewModerationBatcher],
+) -> TaskID:
+    return await review_moderation_batcher.submit(
+        (event.review_id, to_processed_message(ADDED_REVIEWS_QUEUE.name, message))
+    )
@@ -0,0 +1,83 @@
+from collections.abc import Sequence
+from dataclasses import replace
+from uuid import UUID
+
+from bazario.asyncio import Sender
+from dishka import AsyncContainer
+
+from moderation.application.operations.write.moderate_contents import (
+    ModerateContents,
+)
+from moderation.domain.tasks.exceptions import ModerationTaskAlreadyExistsError
+from moderation.domain.tasks.task_id import TaskID
+from moderation.domain.tasks.value_objects import ContentType
+from moderation.infrastructure.inbox.inbox_buffer import (
+    DuplicateMessageError,
+    InboxBuffer,
+)
+from moderation.infrastructure.inbox.processed_message import ProcessedMessage
+from moderation.infrastructure.inbox.processed_message_filter import (
+    ProcessedMessageFilter,
+)
+from moderation.presentation.stream.concurrency_limiter import (
+    ConsumerConcurrencyLimiters,
+)
+from moderation.presentation.stream.message_batcher import MessageBatcher
+
+
+class ContentModerationBatcher(
+    MessageBatcher[tuple[UUID, ProcessedMessage | None], TaskID]
+):
+    def __init__(
+        self,
+        container: AsyncContainer,
+        content_type: ContentType,
+        concurrency_limiters: ConsumerConcurrencyLimiters,
+        consumer: str,
+        *,
+        max_size: int,
+        max_delay: float,
+        assume_new: bool = False,
+    ) -> None:
+        super().__init__(max_size=max_size, max_delay=max_delay)
+        self._container = container
+        self._content_type = content_type
+        self._concurrency_limiters = concurrency_limiters
+        self._consumer = consumer
+        self._assume_new = assume_new
+
+    async def _handle_batch(
+        self, messages: Sequence[tuple[UUID, ProcessedMessage | None]]
+    ) -> Sequence[TaskID]:
+        command = ModerateContents(
+            content_type=self._content_type,
+            content_ids=tuple(content_id for content_id, _ in messages),
+            assume_new=self._assume_new,
+        )
+
+        async with (
+            self._concurrency_limiters.acquire(self._consumer),
+            self._container() as request_container,
+        ):
+            sender = await request_container.get(Sender)
+            inbox_buffer = await request_container.get(InboxBuffer)
+            inbox_buffer.add_many(
+                processed_message
+                for _, processed_message in messages
+                if processed_message
+            )
+
+            try:
+                task_ids: list[TaskID] = await sender.send(request=command)
+            except ModerationTaskAlreadyExistsError:
+                task_ids = await sender.send(request=replace(command, assume_new=False))
+            except DuplicateMessageError as error:
+                processed_message_filter = await request_container.get(
+                    ProcessedMessageFilter
+                )
+                for processed_message in error.messages:
+                    processed_message_filter.record_database_hit(processed_message)
+
+                task_ids = await sender.send(request=replace(command, assume_new=False))
+
+        return task_ids
@@ -0,0 +1,58 @@
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from faststream import BaseMiddleware, context
+from faststream.broker.message import StreamMessage
+
+from moderation.infrastructure.inbox.inbox_buffer import DuplicateMessageError
+from moderation.infrastructure.inbox.processed_message import ProcessedMessage
+from moderation.infrastructure.inbox.processed_message_filter import (
+    ProcessedMessageFilter,
+)
+
+
+def to_processed_message(
+    consumer: str, msg: StreamMessage[Any]
+) -> ProcessedMessage | None:
+    message_id = getattr(msg.raw_message, "message_id", None)
+
+    if not message_id:
+        return None
+
+    return ProcessedMessage(consumer=consumer, message_id=message_id)
+
+
+class InboxMiddleware(BaseMiddleware):
+    def __init__(self, consumer: str, msg: Any | None = None) -> None:
+        super().__init__(msg)
+        self._consumer = consumer
+
+    async def consume_scope(
+        self,
+        call_next: Callable[[Any], Awaitable[Any]],
+        msg: StreamMessage[Any],
+    ) -> Any:
+        processed_message = to_processed_message(self._consumer, msg)
+
+        if processed_message is None:
+            return await call_next(msg)
+
+        request_container = context.get_local("dishka")
+        processed_message_filter: ProcessedMessageFilter = await request_container.get(
+            ProcessedMessageFilter
+        )
+
+        if processed_message_filter.seen(processed_message):
+            return None
+
+        try:
+            result = await call_next(msg)
+        except DuplicateMessageError as error:
+            if processed_message not in error.messages:
+                raise
+
+            processed_message_filter.record_database_hit(processed_message)
+            return None
+
+        processed_message_filter.remember(processed_message)
+        return result
@@ -0,0 +1,60 @@
+import asyncio
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+
+
+class MessageBatcher[T, R](ABC):
+    def __init__(self, *, max_size: int, max_delay: float) -> None:
+        self._max_size = max_size
+        self._max_delay = max_delay
+        self._pending: list[tuple[T, asyncio.Future[R]]] = []
+        self._flush_timer: asyncio.TimerHandle | None = None
+        self._running_batches: set[asyncio.Task[None]] = set()
+
+    async def submit(self, message: T) -> R:
+        future: asyncio.Future[R] = asyncio.get_running_loop().create_future()
+        self._pending.append((message, future))
+
+        if len(self._pending) >= self._max_size:
+            self._flush()
+        elif self._flush_timer is None:
+            self._flush_timer = asyncio.get_running_loop().call_later(
+                self._max_delay, self._flush
+            )
+
+        return await future
+
+    async def close(self) -> None:
+        self._flush()
+
+        if self._running_batches:
+            await asyncio.wait(self._running_batches)
+
+    @abstractmethod
+    async def _handle_batch(self, messages: Sequence[T]) -> Sequence[R]: ...
+
+    def _flush(self) -> None:
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+
+        if not self._pending:
+            return
+
+        batch, self._pending = self._pending, []
+        task = asyncio.create_task(self._run_batch(batch))
+        self._running_batches.add(task)
+        task.add_done_callback(self._running_batches.discard)
+
+    async def _run_batch(self, batch: list[tuple[T, asyncio.Future[R]]]) -> None:
+        try:
+            results = await self._handle_batch([message for message, _ in batch])
+        except Exception as error:  # noqa: BLE001
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(error)
+            return
+
+        for (_, future), result in zip(batch, results, strict=True):
+            if not future.done():
+                future.set_result(result)